@@ -23,7 +23,6 @@ behaves like invoking the CLI directly.
 from __future__ import annotations
 
 from .models import Options
-from .pipeline import pdf_to_markdown
 
 __all__ = ["Options", "pdf_to_markdown", "__version__"]
 
@@ -32,6 +31,15 @@ __all__ = ["Options", "pdf_to_markdown", "__version__"]
 __version__ = "1.6.0"
 
 
+def __getattr__(name: str):
+    # The pipeline pulls in PyMuPDF and the OCR helpers; import it on first
+    # use so `import pdfmd.app_gui` (and friends) start quickly.
+    if name == "pdf_to_markdown":
+        from .pipeline import pdf_to_markdown
+        return pdf_to_markdown
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main() -> None:
     """Entry point alias for `python -m pdfmd.cli`.
 
@@ -20,19 +20,27 @@ or:
 """
 from __future__ import annotations
 
+import collections
+import hashlib
+import importlib
+import importlib.util
 import json
+import multiprocessing
 import os
-import platform
-import subprocess
-import threading
+import queue
+import shutil
+import sys
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 
 # ---------------------------------------------------------------------------
 # DPI FIX – stop blurry UI on Windows when scaling > 100%
 # ---------------------------------------------------------------------------
-if platform.system() == "Windows":
+if sys.platform == "win32":
     try:
         import ctypes
         ctypes.windll.user32.SetProcessDPIAware()  # enable system DPI awareness
@@ -40,32 +48,109 @@ if platform.system() == "Windows":
         pass
 # ---------------------------------------------------------------------------
 
-# Optional PyMuPDF import for password probing (GUI pre-checks)
-try:
-    import fitz  # type: ignore
-except Exception:  # pragma: no cover - optional
-    fitz = None  # type: ignore
+# Optional PyMuPDF for password probing (GUI pre-checks). Imported on first
+# use: it is large, and only needed once the user presses Convert.
+_fitz = None
+
+
+def _get_fitz():
+    """Return the PyMuPDF module, or None if it is not installed."""
+    global _fitz
+    if _fitz is None:
+        try:
+            import fitz as _mod  # type: ignore
+        except Exception:  # pragma: no cover - optional
+            _mod = False
+        _fitz = _mod
+    return _fitz or None
+
 
 # --- Robust imports: package or script mode ---------------------------------
 try:
     # Package style, e.g. `python -m pdfmd.app_gui`
+    from pdfmd import __version__ as PDFMD_VERSION
     from pdfmd.models import Options
-    from pdfmd.pipeline import pdf_to_markdown
     from pdfmd.utils import os_display_path
+    _PIPELINE_MODULE = "pdfmd.pipeline"
 except ImportError:  # fallback for `python app_gui.py`
-    import sys
-
     _HERE = Path(__file__).resolve().parent
     if str(_HERE) not in sys.path:
         sys.path.insert(0, str(_HERE))
     from models import Options
-    from pipeline import pdf_to_markdown
     from utils import os_display_path
+    _PIPELINE_MODULE = "pipeline"
+    try:
+        from importlib.metadata import version as _dist_version
+        PDFMD_VERSION = _dist_version("pdfmd")
+    except Exception:
+        PDFMD_VERSION = "unknown"
 # ---------------------------------------------------------------------------
 
+
+def _load_pdf_to_markdown():
+    """Import the conversion pipeline on first use (it pulls in PyMuPDF/OCR)."""
+    return importlib.import_module(_PIPELINE_MODULE).pdf_to_markdown
+
+
+def _choose_opener() -> Callable[[str], object]:
+    """Return the host's "open this folder" launcher, resolved once at import."""
+    if sys.platform == "win32":
+        return os.startfile  # type: ignore[attr-defined]
+    command = "open" if sys.platform == "darwin" else "xdg-open"
+
+    def _open(path: str):
+        # Only needed on click; kept out of module import to speed up startup.
+        import subprocess
+        return subprocess.Popen([command, path])
+
+    return _open
+
+
+_OPEN_FOLDER = _choose_opener()
+
 OCR_CHOICES = ("off", "auto", "tesseract", "ocrmypdf")
 CONFIG_PATH = Path.home() / ".pdfmd_gui.json"
 
+# Fingerprints of finished conversions (input size/mtime, output path,
+# options, pdfmd version and OCR tools), so pressing Convert again on
+# unchanged work can skip the pipeline. Shift+Convert bypasses it.
+CACHE_PATH = Path.home() / ".pdfmd_gui.cache.json"
+MAX_CACHE_ENTRIES = 64
+
+# Upper bound on lines kept in the log panel; older lines are trimmed so
+# long OCR runs don't grow the Text widget (and its redraw cost) without limit.
+MAX_LOG_LINES = 5000
+# Once over the cap, trim back to this many lines so the (costly) delete
+# happens once per ~1000 new lines rather than on every flush.
+LOG_TRIM_TO = 4000
+
+# Delay before queued log lines are written to the panel in one batch.
+LOG_FLUSH_MS = 50
+
+# Keys that move around the (read-only) log panel without editing it.
+_LOG_NAV_KEYS = frozenset(
+    ("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End",
+     "Shift_L", "Shift_R", "Control_L", "Control_R", "Meta_L", "Meta_R")
+)
+
+# Event-state bits for the copy/select-all shortcuts in the log: Control
+# (Windows/X11) and Mod1, which Tk sets for Command on macOS.
+_LOG_SHORTCUT_MODIFIERS = 0x4 | 0x8
+
+# Quiet period before settings changes are persisted; a burst of changes
+# results in a single config write.
+CONFIG_SAVE_DELAY_MS = 500
+
+# Typing/pasting into the input field re-suggests the output path only after
+# this quiet period.
+SUGGEST_DELAY_MS = 150
+
+# How often the Tk thread drains events sent by the conversion process.
+PUMP_INTERVAL_MS = 50
+
+# "spawn" everywhere: forking a process that already runs Tk is unsafe.
+_MP = multiprocessing.get_context("spawn")
+
 # Common Tesseract language codes (user can also type a custom code).
 OCR_LANG_CHOICES = (
     "eng",          # English
@@ -88,7 +173,8 @@ OCR_LANG_CHOICES = (
 )
 
 
-DEFAULT_OPTIONS = {
+# Read-only, so the "Default" profile can share it without a copy.
+DEFAULT_OPTIONS = MappingProxyType({
     "ocr_mode": OCR_CHOICES[0],
     "ocr_lang": "eng",
     "preview": False,
@@ -99,11 +185,45 @@ DEFAULT_OPTIONS = {
     "defrag": True,
     "heading_ratio": 1.15,
     "orphan_len": 45,
-}
+})
+
+
+def _ocr_lang(value) -> str:
+    return str(value).strip() or "eng"
+
+
+# (options-dict key, PdfMdApp variable attribute, pdfmd.models.Options field,
+# value converter): the single mapping behind _options_from_controls,
+# _build_options and _apply_options_dict.
+_OPTIONS_SPEC: tuple[tuple[str, str, str, Callable], ...] = (
+    ("ocr_mode", "ocr_var", "ocr_mode", str),
+    ("ocr_lang", "ocr_lang_var", "ocr_lang", _ocr_lang),
+    ("preview", "preview_var", "preview_only", bool),
+    ("export_images", "export_images_var", "export_images", bool),
+    ("page_breaks", "page_breaks_var", "insert_page_breaks", bool),
+    ("rm_edges", "rm_edges_var", "remove_headers_footers", bool),
+    ("caps_to_headings", "caps_to_headings_var", "caps_to_headings", bool),
+    ("defrag", "defrag_var", "defragment_short", bool),
+    ("heading_ratio", "heading_ratio_var", "heading_size_ratio", float),
+    ("orphan_len", "orphan_len_var", "orphan_max_len", int),
+)
+
+
+def _coerce_option(key: str, conv: Callable, value):
+    """Convert *value* for option *key*, falling back to its default."""
+    try:
+        value = conv(value)
+    except Exception:
+        return DEFAULT_OPTIONS[key]
+    if key == "ocr_mode" and value not in OCR_CHOICES:
+        return OCR_CHOICES[0]
+    return value
+
 
+# Read-only views: profile selection applies them directly, no defensive copies.
 BUILTIN_PROFILES = {
     "Default": DEFAULT_OPTIONS,
-    "Academic article": {
+    "Academic article": MappingProxyType({
         "ocr_mode": "auto",
         "preview": False,
         "export_images": False,
@@ -113,8 +233,8 @@ BUILTIN_PROFILES = {
         "defrag": True,
         "heading_ratio": 1.10,
         "orphan_len": 60,
-    },
-    "Slides / handouts": {
+    }),
+    "Slides / handouts": MappingProxyType({
         "ocr_mode": "auto",
         "preview": False,
         "export_images": True,
@@ -124,8 +244,8 @@ BUILTIN_PROFILES = {
         "defrag": True,
         "heading_ratio": 1.20,
         "orphan_len": 45,
-    },
-    "Scan-heavy / OCR-first": {
+    }),
+    "Scan-heavy / OCR-first": MappingProxyType({
         "ocr_mode": "tesseract",
         "preview": False,
         "export_images": False,
@@ -135,51 +255,353 @@ BUILTIN_PROFILES = {
         "defrag": True,
         "heading_ratio": 1.15,
         "orphan_len": 45,
-    },
+    }),
 }
 
+# Membership checks only; BUILTIN_PROFILES keeps the display order.
+_BUILTIN_PROFILE_NAMES: frozenset[str] = frozenset(BUILTIN_PROFILES)
+
+
+@dataclass(frozen=True)
+class ThemePalette:
+    """Colours for one GUI theme; see THEMES and _theme_styles()."""
+    bg: str
+    card_bg: str
+    card_border: str
+    text: str
+    text_muted: str
+    entry_bg: str
+    hover: str
+    accent: str
+    accent_hover: str
+    status_info: str
+    status_err: str
+    log_bg: str
+    log_fg: str
+    log_border: str
+    sep: str
+    btn_bg: str
+    trough: str
+
+
+THEMES = {
+    # Obsidian dark palette
+    "Dark": ThemePalette(
+        bg="#1e1e1e",
+        card_bg="#252525",
+        card_border="#363636",
+        text="#dcddde",
+        text_muted="#888888",
+        entry_bg="#2d2d2d",
+        hover="#383838",
+        accent="#7b6cd9",
+        accent_hover="#6a5bb5",
+        status_info="#7b6cd9",
+        status_err="#e05252",
+        log_bg="#191919",
+        log_fg="#b0b0b0",
+        log_border="#363636",
+        sep="#333333",
+        btn_bg="#2d2d2d",
+        trough="#2d2d2d",
+    ),
+    # Clean light palette
+    "Light": ThemePalette(
+        bg="#f0f0f0",
+        card_bg="#ffffff",
+        card_border="#d4d4d4",
+        text="#1a1a1a",
+        text_muted="#707070",
+        entry_bg="#ffffff",
+        hover="#e4e4e4",
+        accent="#5b5fc7",
+        accent_hover="#4a4eb5",
+        status_info="#5b5fc7",
+        status_err="#c62828",
+        log_bg="#fafafa",
+        log_fg="#333333",
+        log_border="#d0d0d0",
+        sep="#d4d4d4",
+        btn_bg="#e0e0e0",
+        trough="#e0e0e0",
+    ),
+}
+
+
+def _theme_styles(p: ThemePalette) -> tuple[list[tuple[str, dict]], list[tuple[str, dict]]]:
+    """Return the (style.configure, style.map) calls that apply palette *p*."""
+    configure = [
+        # Frames
+        ("TFrame", {"background": p.bg}),
+        ("Log.TFrame", {"background": p.card_bg}),
+        # Cards (labelframes)
+        ("Card.TLabelframe", {
+            "background": p.card_bg, "foreground": p.text,
+            "bordercolor": p.card_border, "lightcolor": p.card_border,
+            "darkcolor": p.card_border,
+        }),
+        ("Card.TLabelframe.Label", {"background": p.card_bg, "foreground": p.text}),
+        # Labels
+        ("TLabel", {"background": p.bg, "foreground": p.text}),
+        ("Muted.TLabel", {"background": p.bg, "foreground": p.text_muted}),
+        ("Section.TLabel", {"background": p.bg, "foreground": p.text}),
+        ("Status.TLabel", {"background": p.bg, "foreground": p.text}),
+        ("StatusInfo.TLabel", {"background": p.bg, "foreground": p.status_info}),
+        ("StatusError.TLabel", {"background": p.bg, "foreground": p.status_err}),
+        # Inputs
+        *(
+            (name, {"fieldbackground": p.entry_bg, "foreground": p.text, "background": p.entry_bg})
+            for name in ("TEntry", "TCombobox", "TSpinbox")
+        ),
+        # Buttons
+        ("TButton", {"background": p.btn_bg, "foreground": p.text}),
+        ("Accent.TButton", {"background": p.accent, "foreground": "#ffffff"}),
+        # Inside cards, checkbuttons sit on card_bg (clam uses background
+        # for the label area).
+        ("TCheckbutton", {"background": p.card_bg, "foreground": p.text}),
+        ("TSeparator", {"background": p.sep}),
+        ("Horizontal.TProgressbar", {"troughcolor": p.trough, "background": p.accent}),
+    ]
+    both = ("readonly", "!readonly")
+    maps = [
+        ("TCombobox", {
+            "fieldbackground": [(s, p.entry_bg) for s in both],
+            "foreground": [(s, p.text) for s in both],
+            "background": [(s, p.entry_bg) for s in both],
+            "selectbackground": [(s, p.accent) for s in both],
+            "selectforeground": [(s, "#ffffff") for s in both],
+        }),
+        ("TSpinbox", {
+            "fieldbackground": [(s, p.entry_bg) for s in both],
+            "foreground": [(s, p.text) for s in both],
+            "background": [(s, p.entry_bg) for s in both],
+        }),
+        ("TButton", {
+            "background": [("active", p.hover), ("disabled", p.bg), ("!active", p.btn_bg)],
+            "foreground": [("disabled", p.text_muted)],
+        }),
+        ("Accent.TButton", {
+            "background": [
+                ("active", p.accent_hover), ("disabled", p.btn_bg), ("!active", p.accent),
+            ],
+            "foreground": [("disabled", p.text_muted), ("!disabled", "#ffffff")],
+        }),
+        ("TCheckbutton", {
+            "background": [("active", p.hover), ("!active", p.card_bg)],
+            "foreground": [("active", p.text), ("!active", p.text)],
+        }),
+    ]
+    return configure, maps
+
+
+_MISSING = object()
+
+
+def _config_digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _ocr_environment(ocr_mode: str) -> list:
+    """What the OCR modes would find installed; empty when OCR is off."""
+    if ocr_mode == "off":
+        return []
+    return [
+        shutil.which("tesseract") or "",
+        shutil.which("ocrmypdf") or "",
+        all(importlib.util.find_spec(m) is not None for m in ("pytesseract", "PIL")),
+    ]
+
+
+def _conversion_fingerprint(in_path: Path, out_path: Path, opts: Mapping[str, object]) -> str:
+    """Digest of everything that decides a conversion's output.
+
+    The input PDF is keyed on its path, size and mtime rather than its bytes,
+    so the check stays instant on the Tk thread even for very large files.
+    The pdfmd version and the installed OCR tools are included so an upgrade
+    or a new Tesseract install triggers a fresh run.
+    """
+    st = os.stat(in_path)
+    key = {
+        "input": os.path.abspath(in_path),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "output": os.path.abspath(out_path),
+        "options": dict(opts),
+        "version": PDFMD_VERSION,
+        "ocr": _ocr_environment(str(opts.get("ocr_mode", "off"))),
+    }
+    payload = json.dumps(key, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class ConversionCache:
+    """Fingerprint -> output mtime for finished single-file conversions.
+
+    Kept as JSON at *path* (CACHE_PATH in the GUI), loaded on first use and
+    written best-effort like the config. The oldest entries are dropped past
+    *max_entries*.
+    """
+
+    def __init__(self, path: Path, max_entries: int = MAX_CACHE_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: dict | None = None
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                data = {}
+            self._entries = data if isinstance(data, dict) else {}
+        return self._entries
+
+    def is_up_to_date(self, fp: str, out_path: Path) -> bool:
+        stored = self._load().get(fp)
+        if stored is None:
+            return False
+        # Exact mtime match: any later write (another option set, a manual
+        # edit) means the file on disk is no longer the one we fingerprinted.
+        try:
+            return bool(os.stat(out_path).st_mtime_ns == stored)
+        except OSError:
+            return False
+
+    def remember(self, fp: str, out_path: Path) -> None:
+        try:
+            mtime = os.stat(out_path).st_mtime_ns
+        except OSError:
+            return
+        cache = self._load()
+        cache.pop(fp, None)
+        cache[fp] = mtime
+        while len(cache) > self.max_entries:
+            del cache[next(iter(cache))]
+        tmp = self.path.with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception:
+            # Best-effort, like the config.
+            pass
+
+
+def _set_if_changed(var: tk.Variable, value) -> None:
+    """Set a tk variable only if it would change, so traces don't fire for nothing."""
+    try:
+        if var.get() == value:
+            return
+    except tk.TclError:  # e.g. a spinbox holding non-numeric text
+        pass
+    var.set(value)
+
+
+class CachedStyle:
+    """ttk.Style wrapper that skips configure/map calls repeating the last values.
+
+    ttk forwards every call to Tcl without checking for changes; re-applying
+    a theme would otherwise redo all of them.
+    """
+
+    def __init__(self, style: ttk.Style) -> None:
+        self._style = style
+        self._cfg: dict[str, dict] = {}
+        self._map: dict[str, dict] = {}
+
+    def configure(self, name: str, **kw):
+        if not kw:
+            return self._style.configure(name)
+        cached = self._cfg.setdefault(name, {})
+        changed = {k: v for k, v in kw.items() if cached.get(k, _MISSING) != v}
+        if changed:
+            self._style.configure(name, **changed)
+            cached.update(changed)
+
+    def map(self, name: str, **kw):
+        if not kw:
+            return self._style.map(name)
+        cached = self._map.setdefault(name, {})
+        changed = {k: v for k, v in kw.items() if cached.get(k, _MISSING) != v}
+        if changed:
+            self._style.map(name, **changed)
+            cached.update(changed)
+
+    def apply(self, configure: list[tuple[str, dict]], maps: list[tuple[str, dict]]) -> None:
+        """Apply many configure/map calls as one Tcl script on the current theme."""
+        settings: dict[str, Any] = {}
+        for kind, calls, store in (("configure", configure, self._cfg), ("map", maps, self._map)):
+            for name, kw in calls:
+                cached = store.setdefault(name, {})
+                changed = {k: v for k, v in kw.items() if cached.get(k, _MISSING) != v}
+                if changed:
+                    settings.setdefault(name, {})[kind] = changed
+                    cached.update(changed)
+        if settings:
+            self._style.theme_settings(self._style.theme_use(), settings)
+
+    def __getattr__(self, attr):
+        return getattr(self._style, attr)
+
 
 class UserCancelled(Exception):
     """Signal that the user requested cancellation."""
     pass
 
 
-class ToolTip:
-    """Themed tooltip with Obsidian-style appearance."""
+class TooltipManager:
+    """Themed tooltips (Obsidian-style) for many widgets via class bindings.
+
+    Widgets are registered with add(); one set of bind_class handlers per
+    widget class serves all of them, and a single Toplevel is reused for
+    every tooltip instead of being created on each hover.
+    """
 
-    def __init__(self, widget: tk.Widget, text: str, delay_ms: int = 400) -> None:
-        self.widget = widget
-        self.text = text
+    def __init__(self, root: tk.Misc, delay_ms: int = 400) -> None:
+        self.root = root
         self.delay_ms = delay_ms
+        self.texts: dict[str, str] = {}
+        self._bound_classes: set[str] = set()
         self._after_id: str | None = None
         self._tip: tk.Toplevel | None = None
-        widget.bind("<Enter>", self._on_enter, add="+")
-        widget.bind("<Leave>", self._on_leave, add="+")
-        widget.bind("<ButtonPress>", self._on_leave, add="+")
-
-    def _on_enter(self, _event=None) -> None:
-        if self._after_id is None:
-            self._after_id = self.widget.after(self.delay_ms, self._show)
+        self._label: tk.Label | None = None
+
+    def add(self, widget: tk.Widget, text: str) -> None:
+        self.texts[str(widget)] = text
+        cls = widget.winfo_class()
+        if cls not in self._bound_classes:
+            self._bound_classes.add(cls)
+            self.root.bind_class(cls, "<Enter>", self._on_enter, add="+")
+            self.root.bind_class(cls, "<Leave>", self._on_leave, add="+")
+            self.root.bind_class(cls, "<ButtonPress>", self._on_leave, add="+")
+            self.root.bind_class(cls, "<Destroy>", self._on_destroy, add="+")
+
+    def _on_enter(self, event) -> None:
+        widget = event.widget
+        if str(widget) not in self.texts:
+            return
+        self._cancel()
+        self._after_id = self.root.after(self.delay_ms, lambda: self._show(widget))
 
     def _on_leave(self, _event=None) -> None:
+        self._cancel()
+        self._hide()
+
+    def _on_destroy(self, event) -> None:
+        # Release the registration so destroyed widgets don't pin their text.
+        if self.texts.pop(str(event.widget), None) is not None:
+            self._on_leave()
+
+    def _cancel(self) -> None:
         if self._after_id is not None:
-            self.widget.after_cancel(self._after_id)
+            self.root.after_cancel(self._after_id)
             self._after_id = None
-        self._hide()
 
-    def _show(self) -> None:
+    def _ensure_tip(self) -> None:
         if self._tip is not None:
             return
-        try:
-            x, y, _, h = self.widget.bbox("insert")
-        except tk.TclError:
-            x = y = h = 0
-        x += self.widget.winfo_rootx() + 20
-        y += self.widget.winfo_rooty() + h + 16
-
-        tip = tk.Toplevel(self.widget)
+        tip = tk.Toplevel(self.root)
+        tip.withdraw()
         tip.wm_overrideredirect(True)
-        tip.wm_geometry(f"+{x}+{y}")
         # Dark tooltip regardless of theme
         tip.configure(bg="#1a1a1a")
         frame = tk.Frame(
@@ -187,17 +609,149 @@ class ToolTip:
             highlightbackground="#444444", highlightthickness=1,
         )
         frame.pack(fill="both", expand=True)
-        label = tk.Label(
-            frame, text=self.text, justify="left", wraplength=340,
+        self._label = tk.Label(
+            frame, text="", justify="left", wraplength=340,
             bg="#1a1a1a", fg="#cccccc", font=("Segoe UI", 9),
         )
-        label.pack()
+        self._label.pack()
         self._tip = tip
 
+    def _show(self, widget: tk.Widget) -> None:
+        self._after_id = None
+        text = self.texts.get(str(widget))
+        if not text:
+            return
+        try:
+            x, y, _, h = widget.bbox("insert")
+        except tk.TclError:
+            x = y = h = 0
+        try:
+            x += widget.winfo_rootx() + 20
+            y += widget.winfo_rooty() + h + 16
+        except tk.TclError:  # widget went away while the show was pending
+            return
+
+        self._ensure_tip()
+        assert self._tip is not None and self._label is not None
+        self._label.configure(text=text)
+        self._tip.wm_geometry(f"+{x}+{y}")
+        self._tip.deiconify()
+        self._tip.lift()
+
     def _hide(self) -> None:
         if self._tip is not None:
-            self._tip.destroy()
-            self._tip = None
+            self._tip.withdraw()
+
+
+def _pipeline_entry(
+    jobs: list[tuple[Path, Path]],
+    opts: Options,
+    pdf_password: str | None,
+    events,
+    cancel_evt,
+) -> None:
+    """Run the conversion jobs in a child process (see PdfMdApp._on_convert).
+
+    Talks to the GUI only through the *events* queue:
+        ("log", msg), ("progress", pct), ("status", text, kind),
+        ("open_folder", enabled), ("error", message), ("succeeded", out_path)
+        per finished job, and a final ("finished",).
+    """
+    pdf_to_markdown = _load_pdf_to_markdown()
+    total_jobs = len(jobs)
+    successes = 0
+    failures = 0
+    last_pct = -1
+
+    def log(msg: str) -> None:
+        events.put(("log", str(msg)))
+
+    def cancelled() -> None:
+        log("Cancelled by user.")
+        events.put(("status", "Cancelled.", "info"))
+        events.put(("open_folder", False))
+
+    try:
+        for job_idx, (inp, outp) in enumerate(jobs):
+            if cancel_evt.is_set():
+                cancelled()
+                return
+
+            if total_jobs > 1:
+                log(f"\n{'='*60}")
+                log(f"[{job_idx + 1}/{total_jobs}] {inp.name}")
+                log(f"{'='*60}")
+
+            log(f"Input:  {os_display_path(str(inp))}")
+            log(f"Output: {os_display_path(str(outp))}")
+            log(f"OCR mode: {opts.ocr_mode}")
+
+            def make_progress_cb(idx: int) -> callable:
+                def wrapped_progress(done: int, total: int) -> None:
+                    nonlocal last_pct
+                    if cancel_evt.is_set():
+                        raise UserCancelled("Cancelled by user")
+                    if total_jobs > 1 and total > 0:
+                        # Scale progress across all jobs
+                        base = int(idx * 100 / total_jobs)
+                        span = 100 / total_jobs
+                        pct = base + int(done * span / total)
+                    else:
+                        try:
+                            pct = int((done / total) * 100) if total > 0 else 0
+                        except Exception:
+                            pct = max(0, min(100, done))
+                    # Stages report far more often than the bar can visibly move.
+                    if pct != last_pct:
+                        last_pct = pct
+                        events.put(("progress", pct))
+                return wrapped_progress
+
+            def wrapped_log(msg: str) -> None:
+                if cancel_evt.is_set():
+                    raise UserCancelled("Cancelled by user")
+                log(msg)
+
+            try:
+                pdf_to_markdown(
+                    str(inp),
+                    str(outp),
+                    opts,
+                    progress_cb=make_progress_cb(job_idx),
+                    log_cb=wrapped_log,
+                    pdf_password=pdf_password,
+                )
+                successes += 1
+                events.put(("succeeded", str(outp)))
+            except UserCancelled:
+                cancelled()
+                return
+            except Exception as e:
+                failures += 1
+                log(f"Error converting {inp.name}: {e}")
+                if total_jobs == 1:
+                    events.put(("status", "Conversion failed. See log for details.", "error"))
+                    events.put(("error", f"An error occurred:\n{e}"))
+                    events.put(("open_folder", False))
+                    return
+
+        # All jobs done
+        if total_jobs == 1:
+            log("Done.")
+            events.put(("status", "Conversion complete.", "info"))
+        else:
+            summary = f"Batch complete: {successes} succeeded"
+            if failures:
+                summary += f", {failures} failed"
+            log(f"\n{summary}.")
+            kind = "info" if failures == 0 else "error"
+            events.put(("status", f"{summary}.", kind))
+        events.put(("open_folder", True))
+
+    finally:
+        pdf_password = None  # type: ignore[assignment]
+        events.put(("finished",))
+
 
 class PdfMdApp(tk.Tk):
     def __init__(self) -> None:
@@ -207,12 +761,32 @@ class PdfMdApp(tk.Tk):
         self.geometry("1020x680")
         self.minsize(960, 620)
 
-        self._worker: threading.Thread | None = None
-        self._cancel_requested: bool = False
+        self._worker: multiprocessing.process.BaseProcess | None = None
+        self._worker_finished: bool = False
+        self._conv_cache = ConversionCache(CACHE_PATH)
+        self._force_convert = False
+        self._pending_fingerprint: tuple[str, Path] | None = None
+        self._events: multiprocessing.queues.Queue | None = None
+        self._cancel_evt = _MP.Event()
         self._last_output_path: str | None = None
         self._input_paths: list[str] = []
         self.custom_profiles: dict[str, dict] = {}
 
+        # Log lines are queued here and flushed to the panel in batches.
+        self._log_queue: collections.deque[str] = collections.deque(maxlen=MAX_LOG_LINES)
+        self._log_flush_pending: bool = False
+
+        # Parsed config and a digest of the bytes last read/written, so
+        # unchanged settings never hit the disk again.
+        self._config_cache: dict = {}
+        self._last_cfg_hash: bytes | None = None
+        self._save_after_id: str | None = None
+        self._suggest_after_id: str | None = None
+        self._profile_values_cache: tuple[str, ...] = ()
+
+        self._tooltips = TooltipManager(self)
+        self._applied_theme: str | None = None
+
         self._init_style()
         self._build_vars()
         self._load_config()
@@ -225,7 +799,7 @@ class PdfMdApp(tk.Tk):
 
     # ------------------------------------------------------------------ style
     def _init_style(self) -> None:
-        style = ttk.Style(self)
+        style = self._style = CachedStyle(ttk.Style(self))
         try:
             style.theme_use("clam")
         except tk.TclError:
@@ -292,6 +866,13 @@ class PdfMdApp(tk.Tk):
         self.heading_ratio_var = tk.DoubleVar(value=1.15)
         self.orphan_len_var = tk.IntVar(value=45)
 
+        # _OPTIONS_SPEC with the variables resolved once:
+        # (key, var, Options field, converter).
+        self._opt_specs: tuple[tuple[str, tk.Variable, str, Callable], ...] = tuple(
+            (key, getattr(self, attr), field, conv)
+            for key, attr, field, conv in _OPTIONS_SPEC
+        )
+
         # Dark is the default; Light is the alternate
         self.theme_var = tk.StringVar(value="Dark")
 
@@ -304,21 +885,26 @@ class PdfMdApp(tk.Tk):
         if not CONFIG_PATH.exists():
             return
         try:
-            data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            raw = CONFIG_PATH.read_bytes()
+            data = json.loads(raw.decode("utf-8"))
         except Exception:
             return
+        if not isinstance(data, dict):
+            return
+        self._config_cache = data
+        self._last_cfg_hash = _config_digest(raw)
 
         theme = data.get("theme")
         if theme in ("Dark", "Light"):
-            self.theme_var.set(theme)
+            _set_if_changed(self.theme_var, theme)
 
         last_input = data.get("last_input")
         if isinstance(last_input, str):
-            self.in_path_var.set(last_input)
+            _set_if_changed(self.in_path_var, last_input)
 
         last_output = data.get("last_output")
         if isinstance(last_output, str):
-            self.out_path_var.set(last_output)
+            _set_if_changed(self.out_path_var, last_output)
             self._last_output_path = last_output
 
         opts = data.get("options")
@@ -333,20 +919,51 @@ class PdfMdApp(tk.Tk):
                 if isinstance(opt, dict)
             }
 
+    def _queue_save(self) -> None:
+        """Persist settings after a short quiet period (debounced)."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(CONFIG_SAVE_DELAY_MS, self._do_save)
+
+    def _do_save(self) -> None:
+        self._save_after_id = None
+        self._save_config()
+
     def _save_config(self) -> None:
-        """Persist theme, paths, options, and custom profiles globally."""
+        """Persist theme, paths, options, and custom profiles globally.
+
+        Skips the write entirely when the serialized settings are identical
+        to what is already on disk.
+        """
         data = {
+            # Keep keys we don't know about (e.g. from a newer version).
+            **self._config_cache,
             "theme": self.theme_var.get(),
             "last_input": self.in_path_var.get().strip(),
             "last_output": self.out_path_var.get().strip(),
             "options": self._options_from_controls(),
             "profiles": self.custom_profiles,
         }
+        self._config_cache = data
+        # Compact encoding keeps the write small; the file is still plain JSON.
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        digest = _config_digest(payload)
+        if digest == self._last_cfg_hash:
+            return
+        # Write a temp file and rename it over the config, so an interrupted
+        # save never leaves a truncated file behind for _load_config.
+        tmp = CONFIG_PATH.with_suffix(".json.tmp")
         try:
-            CONFIG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.write_bytes(payload)
+            os.replace(tmp, CONFIG_PATH)
         except Exception:
             # Fail silently; persistence is best-effort.
-            pass
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        self._last_cfg_hash = digest
 
     # --------------------------------------------------------------------- UI
     def _build_ui(self) -> None:
@@ -389,7 +1006,11 @@ class PdfMdApp(tk.Tk):
         ttk.Button(files_card, text="Browse\u2026", command=self._choose_input).grid(
             row=0, column=2, sticky="e", padx=(10, 0), pady=6,
         )
-        ToolTip(in_entry, "Select one or more PDFs to convert.\nAll processing is 100% local \u2014 nothing leaves your machine.")
+        self._tooltips.add(
+            in_entry,
+            "Select one or more PDFs to convert.\n"
+            "All processing is 100% local \u2014 nothing leaves your machine.",
+        )
 
         ttk.Label(files_card, text="Output:").grid(row=1, column=0, sticky="w", padx=(0, 10), pady=6)
         out_entry = ttk.Entry(files_card, textvariable=self.out_path_var)
@@ -397,14 +1018,118 @@ class PdfMdApp(tk.Tk):
         ttk.Button(files_card, text="Browse\u2026", command=self._choose_output).grid(
             row=1, column=2, sticky="e", padx=(10, 0), pady=6,
         )
-        ToolTip(out_entry, "Output .md file (single input) or folder (batch).")
+        self._tooltips.add(out_entry, "Output .md file (single input) or folder (batch).")
 
         # ===================== OPTIONS CARD ====================================
         opts_card = ttk.Labelframe(root, text="\u2002Options", style="Card.TLabelframe")
         opts_card.pack(fill="x", pady=(0, 10))
 
+        # The option widgets are only built when first expanded; until then
+        # the tk variables alone carry the settings.
+        self._opts_body: ttk.Frame | None = None
+        self._opts_toggle = ttk.Button(
+            opts_card, text="Show advanced options \u25b8", command=self._toggle_options,
+        )
+        self._opts_toggle.pack(anchor="w")
+        self._opts_card = opts_card
+
+        # ===================== PROGRESS & LOG CARD =============================
+        log_card = ttk.Labelframe(root, text="\u2002Progress & Log", style="Card.TLabelframe")
+        log_card.pack(fill="both", expand=True)
+
+        # --- Action row: Convert + Stop + Progress bar + Status ---
+        action_row = ttk.Frame(log_card)
+        action_row.pack(fill="x", pady=(0, 8))
+
+        self.go_btn = ttk.Button(
+            action_row, text="\u25b6  Convert",
+            style="Accent.TButton", command=self._on_convert_clicked,
+        )
+        self.go_btn.pack(side="left", padx=(0, 8))
+        self.go_btn.bind("<ButtonPress-1>", self._note_convert_modifiers, add="+")
+        self._tooltips.add(
+            self.go_btn,
+            "Start conversion  (Ctrl+Enter)\n"
+            "Shift+click (Ctrl+Shift+Enter) re-converts even if the output is up to date.",
+        )
+
+        self.stop_btn = ttk.Button(
+            action_row, text="Stop", command=self._on_cancel,
+        )
+        self.stop_btn.pack(side="left", padx=(0, 14))
+        self.stop_btn.configure(state="disabled")
+        self._tooltips.add(self.stop_btn, "Cancel  (Esc)")
+
+        self.pbar = ttk.Progressbar(
+            action_row, orient="horizontal", mode="determinate", maximum=100,
+        )
+        self.pbar.pack(side="left", fill="x", expand=True, padx=(0, 10))
+
+        info_frame = ttk.Frame(action_row)
+        info_frame.pack(side="right")
+
+        self.status_label = ttk.Label(
+            info_frame, text="", style="StatusInfo.TLabel", anchor="e",
+        )
+        self.status_label.pack(side="left", padx=(0, 6))
+
+        self.open_folder_link = ttk.Label(
+            info_frame, text="", style="StatusInfo.TLabel", cursor="hand2",
+        )
+        self.open_folder_link.pack(side="left")
+        self.open_folder_link.bind("<Button-1>", self._on_open_folder)
+
+        # --- Log text area with inset border ---
+        log_outer = tk.Frame(
+            log_card, bd=0, highlightthickness=1,
+            highlightbackground="#333333",
+        )
+        log_outer.pack(fill="both", expand=True, pady=(0, 2))
+
+        self.log_txt = tk.Text(
+            log_outer,
+            wrap="word",
+            height=8,
+            font=self._fonts["log"],
+            relief="flat",
+            borderwidth=0,
+            padx=10,
+            pady=8,
+            undo=False,
+            insertwidth=0,
+        )
+        self.log_txt.pack(side="left", fill="both", expand=True)
+
+        # The panel stays in "normal" state so appends need no state toggles;
+        # user edits are swallowed by bindings instead. "all" goes first so
+        # the global shortcuts still fire before the widget tag breaks.
+        self.log_txt.bindtags(("all", str(self.log_txt), "Text", str(self)))
+        self.log_txt.bind("<Key>", self._block_log_edit)
+        for seq in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.log_txt.bind(seq, lambda _e: "break")
+
+        log_scroll = ttk.Scrollbar(log_outer, orient="vertical", command=self.log_txt.yview)
+        log_scroll.pack(side="right", fill="y")
+        self.log_txt.configure(yscrollcommand=log_scroll.set)
+
+        self._log_outer = log_outer
+        self._disable_open_folder_link()
+
+    def _toggle_options(self) -> None:
+        """Show or hide the Options card body, building it on first use."""
+        if self._opts_body is None:
+            self._opts_body = ttk.Frame(self._opts_card)
+            self._build_options_body(self._opts_body)
+        if self._opts_body.winfo_manager():
+            self._opts_body.pack_forget()
+            self._opts_toggle.configure(text="Show advanced options \u25b8")
+        else:
+            self._opts_body.pack(fill="x", pady=(8, 0))
+            self._opts_toggle.configure(text="Hide advanced options \u25be")
+
+    def _build_options_body(self, body: ttk.Frame) -> None:
         # --- OCR settings group ---
-        ocr_group = ttk.Frame(opts_card)
+        ocr_group = ttk.Frame(body)
         ocr_group.pack(fill="x", pady=(0, 8))
 
         ttk.Label(ocr_group, text="OCR mode:").pack(side="left", padx=(0, 6))
@@ -413,7 +1138,7 @@ class PdfMdApp(tk.Tk):
             textvariable=self.ocr_var, width=12, state="readonly",
         )
         ocr_combo.pack(side="left", padx=(0, 20))
-        ToolTip(ocr_combo,
+        self._tooltips.add(ocr_combo,
             "off       \u2013 native text only (fastest)\n"
             "auto      \u2013 detect scanned pages, OCR when needed\n"
             "tesseract \u2013 force Tesseract on every page\n"
@@ -426,7 +1151,7 @@ class PdfMdApp(tk.Tk):
             textvariable=self.ocr_lang_var, width=10,
         )
         self.ocr_lang_combo.pack(side="left")
-        ToolTip(self.ocr_lang_combo,
+        self._tooltips.add(self.ocr_lang_combo,
             "Tesseract language code for OCR.\n"
             "Select from the list or type a custom code.\n"
             "Combine with '+', e.g. 'eng+fra'.\n"
@@ -434,10 +1159,10 @@ class PdfMdApp(tk.Tk):
         )
 
         # --- Visual separator ---
-        ttk.Separator(opts_card, orient="horizontal").pack(fill="x", pady=(4, 8))
+        ttk.Separator(body, orient="horizontal").pack(fill="x", pady=(4, 8))
 
         # --- Output toggles ---
-        out_toggles = ttk.Frame(opts_card)
+        out_toggles = ttk.Frame(body)
         out_toggles.pack(fill="x", pady=(0, 6))
 
         for text, var, pad in [
@@ -450,7 +1175,7 @@ class PdfMdApp(tk.Tk):
             )
 
         # --- Structure toggles ---
-        struct_toggles = ttk.Frame(opts_card)
+        struct_toggles = ttk.Frame(body)
         struct_toggles.pack(fill="x", pady=(0, 6))
 
         for text, var, pad in [
@@ -463,10 +1188,10 @@ class PdfMdApp(tk.Tk):
             )
 
         # --- Visual separator ---
-        ttk.Separator(opts_card, orient="horizontal").pack(fill="x", pady=(4, 8))
+        ttk.Separator(body, orient="horizontal").pack(fill="x", pady=(4, 8))
 
         # --- Tuning knobs ---
-        tuning = ttk.Frame(opts_card)
+        tuning = ttk.Frame(body)
         tuning.pack(fill="x")
 
         ttk.Label(tuning, text="Heading size ratio:").pack(side="left", padx=(0, 4))
@@ -475,7 +1200,7 @@ class PdfMdApp(tk.Tk):
             textvariable=self.heading_ratio_var, width=6,
         )
         heading_spin.pack(side="left", padx=(0, 28))
-        ToolTip(heading_spin,
+        self._tooltips.add(heading_spin,
             "Font size \u2265 body \u00d7 this ratio \u2192 promoted to heading.\n"
             "Lower = more headings.",
         )
@@ -486,96 +1211,36 @@ class PdfMdApp(tk.Tk):
             textvariable=self.orphan_len_var, width=6,
         )
         orphan_spin.pack(side="left")
-        ToolTip(orphan_spin,
+        self._tooltips.add(orphan_spin,
             "Short isolated lines up to this many characters\n"
             "will be merged into the previous paragraph.",
         )
 
-        # ===================== PROGRESS & LOG CARD =============================
-        log_card = ttk.Labelframe(root, text="\u2002Progress & Log", style="Card.TLabelframe")
-        log_card.pack(fill="both", expand=True)
-
-        # --- Action row: Convert + Stop + Progress bar + Status ---
-        action_row = ttk.Frame(log_card)
-        action_row.pack(fill="x", pady=(0, 8))
-
-        self.go_btn = ttk.Button(
-            action_row, text="\u25b6  Convert",
-            style="Accent.TButton", command=self._on_convert,
-        )
-        self.go_btn.pack(side="left", padx=(0, 8))
-        ToolTip(self.go_btn, "Start conversion  (Ctrl+Enter)")
-
-        self.stop_btn = ttk.Button(
-            action_row, text="Stop", command=self._on_cancel,
-        )
-        self.stop_btn.pack(side="left", padx=(0, 14))
-        self.stop_btn.configure(state="disabled")
-        ToolTip(self.stop_btn, "Cancel  (Esc)")
-
-        self.pbar = ttk.Progressbar(
-            action_row, orient="horizontal", mode="determinate", maximum=100,
-        )
-        self.pbar.pack(side="left", fill="x", expand=True, padx=(0, 10))
-
-        info_frame = ttk.Frame(action_row)
-        info_frame.pack(side="right")
-
-        self.status_label = ttk.Label(
-            info_frame, text="", style="StatusInfo.TLabel", anchor="e",
-        )
-        self.status_label.pack(side="left", padx=(0, 6))
-
-        self.open_folder_link = ttk.Label(
-            info_frame, text="", style="StatusInfo.TLabel", cursor="hand2",
-        )
-        self.open_folder_link.pack(side="left")
-        self.open_folder_link.bind("<Button-1>", self._on_open_folder)
-
-        # --- Log text area with inset border ---
-        log_outer = tk.Frame(
-            log_card, bd=0, highlightthickness=1,
-            highlightbackground="#333333",
-        )
-        log_outer.pack(fill="both", expand=True, pady=(0, 2))
-
-        self.log_txt = tk.Text(
-            log_outer,
-            wrap="word",
-            height=8,
-            font=self._fonts["log"],
-            relief="flat",
-            borderwidth=0,
-            padx=10,
-            pady=8,
-        )
-        self.log_txt.pack(side="left", fill="both", expand=True)
-
-        log_scroll = ttk.Scrollbar(log_outer, orient="vertical", command=self.log_txt.yview)
-        log_scroll.pack(side="right", fill="y")
-        self.log_txt.configure(yscrollcommand=log_scroll.set, state="disabled")
-
-        self._log_outer = log_outer
-        self._disable_open_folder_link()
-
     def _wire_events(self) -> None:
-        self.in_path_var.trace_add("write", lambda *_: self._suggest_output())
+        self.in_path_var.trace_add("write", lambda *_: self._queue_suggest_output())
 
         def on_theme_change(*_):
             self._apply_theme()
-            self._save_config()
+            self._queue_save()
 
         self.theme_var.trace_add("write", on_theme_change)
 
         self.profile_combo.bind("<<ComboboxSelected>>", self._on_profile_selected)
-
-        # Keyboard shortcuts
-        self.bind_all("<Control-o>", lambda e: self._choose_input())
-        self.bind_all("<Control-O>", lambda e: self._choose_input())
-        self.bind_all("<Control-Shift-O>", lambda e: self._choose_output())
-        self.bind_all("<Control-Return>", lambda e: self._on_convert())
-        self.bind_all("<Control-KP_Enter>", lambda e: self._on_convert())
-        self.bind_all("<Escape>", lambda e: self._on_cancel())
+        self.bind("<Map>", self._on_map, add="+")
+
+        # Keyboard shortcuts. Tk key bindings are case-sensitive, so
+        # <Control-O> is kept alongside <Control-o> for Caps Lock users.
+        for seq, action in (
+            ("<Control-o>", self._choose_input),
+            ("<Control-O>", self._choose_input),
+            ("<Control-Shift-O>", self._choose_output),
+            ("<Control-Return>", self._on_convert),
+            ("<Control-KP_Enter>", self._on_convert),
+            ("<Control-Shift-Return>", lambda: self._on_convert(force=True)),
+            ("<Control-Shift-KP_Enter>", lambda: self._on_convert(force=True)),
+            ("<Escape>", self._on_cancel),
+        ):
+            self.bind_all(seq, lambda _e, action=action: action())
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -588,124 +1253,23 @@ class PdfMdApp(tk.Tk):
         if not hasattr(self, "log_txt"):
             return
 
-        style = ttk.Style(self)
         theme = self.theme_var.get()
+        if theme not in THEMES:
+            theme = "Light"
+        # Startup and trace writes re-apply the same theme; skip the Tcl work.
+        if self._applied_theme == theme:
+            return
+        palette = THEMES[theme]
 
-        if theme == "Dark":
-            # -- Obsidian dark palette --
-            bg           = "#1e1e1e"
-            card_bg      = "#252525"
-            card_border  = "#363636"
-            text_color   = "#dcddde"
-            text_muted   = "#888888"
-            entry_bg     = "#2d2d2d"
-            entry_border = "#3a3a3a"
-            hover_bg     = "#383838"
-            accent       = "#7b6cd9"
-            accent_hover = "#6a5bb5"
-            status_info  = "#7b6cd9"
-            status_err   = "#e05252"
-            log_bg       = "#191919"
-            log_fg       = "#b0b0b0"
-            sep_color    = "#333333"
-            btn_bg       = "#2d2d2d"
-            btn_fg       = text_color
-
-        else:
-            # -- Clean light palette --
-            bg           = "#f0f0f0"
-            card_bg      = "#ffffff"
-            card_border  = "#d4d4d4"
-            text_color   = "#1a1a1a"
-            text_muted   = "#707070"
-            entry_bg     = "#ffffff"
-            entry_border = "#c0c0c0"
-            hover_bg     = "#e4e4e4"
-            accent       = "#5b5fc7"
-            accent_hover = "#4a4eb5"
-            status_info  = "#5b5fc7"
-            status_err   = "#c62828"
-            log_bg       = "#fafafa"
-            log_fg       = "#333333"
-            sep_color    = "#d4d4d4"
-            btn_bg       = "#e0e0e0"
-            btn_fg       = text_color
-
-        # -- Window --
-        self.configure(bg=bg)
-
-        # -- Frames --
-        style.configure("TFrame", background=bg)
-        style.configure("Log.TFrame", background=card_bg)
-
-        # -- Cards (labelframes) --
-        style.configure(
-            "Card.TLabelframe",
-            background=card_bg, foreground=text_color,
-            bordercolor=card_border, lightcolor=card_border, darkcolor=card_border,
-        )
-        style.configure("Card.TLabelframe.Label", background=card_bg, foreground=text_color)
-
-        # -- Labels --
-        style.configure("TLabel", background=bg, foreground=text_color)
-        style.configure("Muted.TLabel", background=bg, foreground=text_muted)
-        style.configure("Section.TLabel", background=bg, foreground=text_color)
-        style.configure("Status.TLabel", background=bg, foreground=text_color)
-        style.configure("StatusInfo.TLabel", background=bg, foreground=status_info)
-        style.configure("StatusError.TLabel", background=bg, foreground=status_err)
-
-        # -- Inputs --
-        for widget_style in ("TEntry", "TCombobox", "TSpinbox"):
-            style.configure(widget_style, fieldbackground=entry_bg, foreground=text_color, background=entry_bg)
-
-        style.map("TCombobox",
-            fieldbackground=[("readonly", entry_bg), ("!readonly", entry_bg)],
-            foreground=[("readonly", text_color), ("!readonly", text_color)],
-            background=[("readonly", entry_bg), ("!readonly", entry_bg)],
-            selectbackground=[("readonly", accent), ("!readonly", accent)],
-            selectforeground=[("readonly", "#ffffff"), ("!readonly", "#ffffff")],
-        )
-        style.map("TSpinbox",
-            fieldbackground=[("readonly", entry_bg), ("!readonly", entry_bg)],
-            foreground=[("readonly", text_color), ("!readonly", text_color)],
-            background=[("readonly", entry_bg), ("!readonly", entry_bg)],
-        )
-
-        # -- Buttons --
-        style.configure("TButton", background=btn_bg, foreground=btn_fg)
-        style.map("TButton",
-            background=[("active", hover_bg), ("disabled", bg), ("!active", btn_bg)],
-            foreground=[("disabled", text_muted)],
-        )
-
-        # -- Accent button --
-        style.configure("Accent.TButton", background=accent, foreground="#ffffff")
-        style.map("Accent.TButton",
-            background=[("active", accent_hover), ("disabled", btn_bg), ("!active", accent)],
-            foreground=[("disabled", text_muted), ("!disabled", "#ffffff")],
-        )
+        self._style.apply(*_theme_styles(palette))
 
-        # -- Checkbuttons --
-        # Inside cards, checkbuttons sit on card_bg; outside, on bg.
-        # Clam theme uses background for the label area.
-        style.configure("TCheckbutton", background=card_bg, foreground=text_color)
-        style.map("TCheckbutton",
-            background=[("active", hover_bg), ("!active", card_bg)],
-            foreground=[("active", text_color), ("!active", text_color)],
+        self.configure(bg=palette.bg)
+        self.log_txt.configure(
+            bg=palette.log_bg, fg=palette.log_fg, insertbackground=palette.log_fg,
         )
-
-        # -- Separators --
-        style.configure("TSeparator", background=sep_color)
-
-        # -- Progress bar --
-        trough = entry_bg if theme == "Dark" else "#e0e0e0"
-        style.configure("Horizontal.TProgressbar", troughcolor=trough, background=accent)
-
-        # -- Log area --
-        self.log_txt.configure(bg=log_bg, fg=log_fg, insertbackground=log_fg)
         if hasattr(self, "_log_outer"):
-            border_col = card_border if theme == "Dark" else "#d0d0d0"
-            self._log_outer.configure(highlightbackground=border_col)
+            self._log_outer.configure(highlightbackground=palette.log_border)
+        self._applied_theme = theme
 
     # ----------------------------------------------------------------- helpers
     def _set_status(self, text: str, kind: str = "info") -> None:
@@ -715,9 +1279,16 @@ class PdfMdApp(tk.Tk):
         self.status_label.configure(text=text, style=style)
 
     def _clear_log(self) -> None:
-        self.log_txt.configure(state="normal")
         self.log_txt.delete("1.0", "end")
-        self.log_txt.configure(state="disabled")
+
+    @staticmethod
+    def _block_log_edit(event):
+        # Read-only log: allow copy, select-all and navigation; drop the rest.
+        if event.state & _LOG_SHORTCUT_MODIFIERS and event.keysym.lower() in ("c", "a", "insert"):
+            return None
+        if event.keysym in _LOG_NAV_KEYS:
+            return None
+        return "break"
 
     def _disable_open_folder_link(self) -> None:
         self.open_folder_link.configure(text="")
@@ -748,12 +1319,16 @@ class PdfMdApp(tk.Tk):
                 self.out_path_var.set(os_display_path(directory))
             return
 
-        base = self.out_path_var.get().strip() or self.in_path_var.get().strip() or "output.md"
-        initial = Path(base).name if base else "output.md"
+        # Parse the current path once and derive both dialog hints from it.
+        current = self.out_path_var.get().strip()
+        base = Path(current or self.in_path_var.get().strip() or "output.md")
+        initial = base.name if current else base.stem + ".md"
+        initial_dir = str(base.parent) if base.parent.parts else None
 
         path = filedialog.asksaveasfilename(
             title="Save Markdown as…",
             defaultextension=".md",
+            initialdir=initial_dir,
             initialfile=initial,
             filetypes=[("Markdown files", "*.md"), ("All files", "*.*")],
         )
@@ -761,6 +1336,16 @@ class PdfMdApp(tk.Tk):
             return
         self.out_path_var.set(os_display_path(path))
 
+    def _queue_suggest_output(self) -> None:
+        """Debounce _suggest_output so a burst of keystrokes runs it once."""
+        if self._suggest_after_id is not None:
+            self.after_cancel(self._suggest_after_id)
+        self._suggest_after_id = self.after(SUGGEST_DELAY_MS, self._run_suggest_output)
+
+    def _run_suggest_output(self) -> None:
+        self._suggest_after_id = None
+        self._suggest_output()
+
     def _suggest_output(self) -> None:
         raw = self.in_path_var.get().strip()
         if not raw:
@@ -775,27 +1360,29 @@ class PdfMdApp(tk.Tk):
                 except Exception:
                     pass
             return
-        try:
-            p = Path(raw)
-            out = p.with_suffix(".md")
-            if not self.out_path_var.get().strip():
-                self.out_path_var.set(os_display_path(out))
-        except Exception:
-            # ignore bad paths
-            pass
+        if self.out_path_var.get().strip():
+            return
+        # Plain string split: this runs after every edit of the input field.
+        root, _ext = os.path.splitext(raw)
+        if root and not root.endswith(("/", "\\")):
+            self.out_path_var.set(os_display_path(root + ".md"))
 
     # ----------------------------------------------------------- profile logic
     def _populate_profiles(self) -> None:
-        names = list(BUILTIN_PROFILES.keys()) + sorted(self.custom_profiles.keys())
+        names = (*BUILTIN_PROFILES, *sorted(self.custom_profiles))
         if not names:
-            names = ["Default"]
-        self.profile_combo["values"] = names
+            names = ("Default",)
+        # Skip the Tcl option write when the list hasn't changed.
+        if names != self._profile_values_cache:
+            self._profile_values_cache = names
+            self.profile_combo["values"] = names
         if self.profile_var.get() not in names:
             self.profile_var.set("Default")
 
     def _on_profile_selected(self, _event=None) -> None:
         name = self.profile_var.get()
-        if name in BUILTIN_PROFILES:
+        opts: Mapping[str, object]
+        if name in _BUILTIN_PROFILE_NAMES:
             opts = BUILTIN_PROFILES[name]
         elif name in self.custom_profiles:
             opts = self.custom_profiles[name]
@@ -811,7 +1398,7 @@ class PdfMdApp(tk.Tk):
         name = name.strip()
         if not name:
             return
-        if name in BUILTIN_PROFILES:
+        if name in _BUILTIN_PROFILE_NAMES:
             messagebox.showinfo(
                 "Cannot overwrite built-in profile",
                 f'"{name}" is a built-in profile name.\n\n'
@@ -830,12 +1417,12 @@ class PdfMdApp(tk.Tk):
         self.custom_profiles[name] = self._options_from_controls()
         self.profile_var.set(name)
         self._populate_profiles()
-        self._save_config()
+        self._queue_save()
         self._log(f"[profile] Saved profile: {name}")
 
     def _delete_profile(self) -> None:
         name = self.profile_var.get()
-        if name in BUILTIN_PROFILES:
+        if name in _BUILTIN_PROFILE_NAMES:
             messagebox.showinfo(
                 "Built-in profile",
                 "Built-in profiles cannot be deleted.",
@@ -859,7 +1446,7 @@ class PdfMdApp(tk.Tk):
         self.profile_var.set("Default")
         self._apply_options_dict(BUILTIN_PROFILES["Default"])
         self._populate_profiles()
-        self._save_config()
+        self._queue_save()
         self._log(f"[profile] Deleted profile: {name}")
 
     # ----------------------------------------------------------- convert logic
@@ -895,14 +1482,23 @@ class PdfMdApp(tk.Tk):
                 return candidate
             n += 1
 
-    def _on_convert(self) -> None:
-        # Prevent multiple concurrent runs
+    def _note_convert_modifiers(self, event) -> None:
+        # Shift held when the Convert button is pressed forces a fresh run.
+        self._force_convert = bool(event.state & 0x1)
+
+    def _on_convert_clicked(self) -> None:
+        force, self._force_convert = self._force_convert, False
+        self._on_convert(force=force)
+
+    def _on_convert(self, force: bool = False) -> None:
+        # Prevent multiple concurrent runs. Only the keyboard shortcut gets
+        # here (Convert is disabled while busy); answer in the status line
+        # rather than with a modal dialog over the running job's updates.
         if self._worker is not None and self._worker.is_alive():
-            messagebox.showinfo(
-                "Conversion in progress",
-                "A conversion is already running.\n\n"
-                "Please wait for it to finish or press Stop.",
-                parent=self,
+            self.bell()
+            self._set_status(
+                "A conversion is already running. Wait for it to finish or press Stop.",
+                kind="error",
             )
             return
 
@@ -911,19 +1507,22 @@ class PdfMdApp(tk.Tk):
             messagebox.showwarning("Missing input PDF", "Please choose an input PDF.", parent=self)
             return
 
-        # Validate every input
+        # Validate every input: the suffix check is string-only, then a
+        # single stat() covers existence.
         for in_path in inputs:
-            if not in_path.exists():
+            if in_path.suffix.lower() != ".pdf":
                 messagebox.showerror(
-                    "Input not found",
-                    f"Input file does not exist:\n{os_display_path(str(in_path))}",
+                    "Input is not a PDF",
+                    f"Not a PDF file:\n{os_display_path(str(in_path))}",
                     parent=self,
                 )
                 return
-            if in_path.suffix.lower() != ".pdf":
+            try:
+                os.stat(in_path)
+            except OSError:
                 messagebox.showerror(
-                    "Input is not a PDF",
-                    f"Not a PDF file:\n{os_display_path(str(in_path))}",
+                    "Input not found",
+                    f"Input file does not exist:\n{os_display_path(str(in_path))}",
                     parent=self,
                 )
                 return
@@ -948,15 +1547,41 @@ class PdfMdApp(tk.Tk):
         else:
             in_path = inputs[0]
             if not outp:
-                outp = os_display_path(in_path.with_suffix(".md"))
+                outp = os_display_path(os.path.splitext(str(in_path))[0] + ".md")
                 self.out_path_var.set(outp)
             jobs.append((in_path, Path(outp)))
 
         self._last_output_path = str(jobs[-1][1])
 
+        # Single-file runs: skip the pipeline when this exact input, output
+        # and option set already produced the file that is still on disk.
+        self._pending_fingerprint = None
+        if not multiple:
+            inp, out = jobs[0]
+            opts_dict = self._options_from_controls()
+            try:
+                fp = _conversion_fingerprint(inp, out, opts_dict)
+            except OSError:
+                fp = None
+            if fp is not None:
+                # Exported images live next to the .md; they must still exist too.
+                assets_ok = (
+                    not opts_dict["export_images"]
+                    or out.with_name(out.stem + "_assets").is_dir()
+                )
+                if assets_ok and not force and self._conv_cache.is_up_to_date(fp, out):
+                    self._clear_log()
+                    self._log("Up-to-date; skipping conversion (Shift+Convert re-runs it).")
+                    self.pbar.configure(value=100)
+                    self._set_status("Output is up to date.", kind="info")
+                    self._enable_open_folder_link()
+                    return
+                self._pending_fingerprint = (fp, out)
+
         # --- Password pre-check (only for single file) ---
         pdf_password = None
-        if not multiple and fitz is not None:
+        fitz = _get_fitz() if not multiple else None
+        if fitz is not None:
             try:
                 doc = fitz.open(str(inputs[0]))
                 needs_pass = bool(getattr(doc, "needs_pass", False))
@@ -1003,7 +1628,7 @@ class PdfMdApp(tk.Tk):
                 pdf_password = None
 
         # Now proceed with conversion
-        self._cancel_requested = False
+        self._cancel_evt.clear()
         self._lock_ui(busy=True)
         self._disable_open_folder_link()
         self._clear_log()
@@ -1014,141 +1639,136 @@ class PdfMdApp(tk.Tk):
         else:
             self._set_status("Converting…", kind="info")
 
-        opts = Options(
-            ocr_mode=self.ocr_var.get(),
-            ocr_lang=self.ocr_lang_var.get().strip() or "eng",
-            preview_only=self.preview_var.get(),
-            caps_to_headings=self.caps_to_headings_var.get(),
-            defragment_short=self.defrag_var.get(),
-            heading_size_ratio=float(self.heading_ratio_var.get()),
-            orphan_max_len=int(self.orphan_len_var.get()),
-            remove_headers_footers=self.rm_edges_var.get(),
-            insert_page_breaks=self.page_breaks_var.get(),
-            export_images=self.export_images_var.get(),
-        )
-
-        # Run pipeline on a background thread; pass password as ephemeral arg
-        self._worker = threading.Thread(
-            target=self._run_pipeline,
-            args=(jobs, opts, pdf_password),
+        # Snapshot the controls once; the worker only ever sees this object.
+        opts = self._build_options()
+
+        # Run the pipeline in a child process so it never competes with the
+        # Tk loop for the GIL. The password only travels over the process
+        # pipe as an argument; it is never written anywhere.
+        self._events = _MP.Queue()
+        self._worker_finished = False
+        self._worker = _MP.Process(
+            target=_pipeline_entry,
+            args=(jobs, opts, pdf_password, self._events, self._cancel_evt),
             daemon=True,
         )
         self._worker.start()
+        pdf_password = None
+        self.after(PUMP_INTERVAL_MS, self._pump)
 
-    def _run_pipeline(
-        self,
-        jobs: list[tuple[Path, Path]],
-        opts: Options,
-        pdf_password: str | None,
-    ) -> None:
-        total_jobs = len(jobs)
-        successes = 0
-        failures = 0
-
-        try:
-            for job_idx, (inp, outp) in enumerate(jobs):
-                if self._cancel_requested:
-                    self._log("Cancelled by user.")
-                    self.after(0, lambda: self._set_status("Cancelled.", kind="info"))
-                    self.after(0, self._disable_open_folder_link)
-                    return
-
-                if total_jobs > 1:
-                    self._log(f"\n{'='*60}")
-                    self._log(f"[{job_idx + 1}/{total_jobs}] {inp.name}")
-                    self._log(f"{'='*60}")
-
-                self._log(f"Input:  {os_display_path(str(inp))}")
-                self._log(f"Output: {os_display_path(str(outp))}")
-                self._log(f"OCR mode: {opts.ocr_mode}")
-
-                def make_progress_cb(idx: int) -> callable:
-                    def wrapped_progress(done: int, total: int) -> None:
-                        if self._cancel_requested:
-                            raise UserCancelled("Cancelled by user")
-                        if total_jobs > 1 and total > 0:
-                            # Scale progress across all jobs
-                            base = int(idx * 100 / total_jobs)
-                            span = 100 / total_jobs
-                            pct = base + int(done * span / total)
-                            self._progress_cb(pct, 100)
-                        else:
-                            self._progress_cb(done, total)
-                    return wrapped_progress
+    # ------------------------------------------------------------ worker pump
+    def _pump(self) -> None:
+        """Apply worker events on the Tk thread, then reschedule while busy."""
+        self._drain_events()
+        self._flush_log()
 
-                def wrapped_log(msg: str) -> None:
-                    if self._cancel_requested:
-                        raise UserCancelled("Cancelled by user")
-                    self._log(msg)
+        worker = self._worker
+        if worker is None:
+            return
+        if worker.is_alive():
+            self.after(PUMP_INTERVAL_MS, self._pump)
+            return
 
-                try:
-                    pdf_to_markdown(
-                        str(inp),
-                        str(outp),
-                        opts,
-                        progress_cb=make_progress_cb(job_idx),
-                        log_cb=wrapped_log,
-                        pdf_password=pdf_password,
-                    )
-                    successes += 1
-                except UserCancelled:
-                    self._log("Cancelled by user.")
-                    self.after(0, lambda: self._set_status("Cancelled.", kind="info"))
-                    self.after(0, self._disable_open_folder_link)
-                    return
-                except Exception as e:
-                    failures += 1
-                    self._log(f"Error converting {inp.name}: {e}")
-                    if total_jobs == 1:
-                        self.after(
-                            0,
-                            lambda: self._set_status("Conversion failed. See log for details.", kind="error"),
-                        )
-                        self.after(
-                            0,
-                            lambda err=e: messagebox.showerror(
-                                "Conversion failed", f"An error occurred:\n{err}", parent=self
-                            ),
-                        )
-                        self.after(0, self._disable_open_folder_link)
-                        return
-
-            # All jobs done
-            if total_jobs == 1:
-                self._log("Done.")
-                self.after(0, lambda: self._set_status("Conversion complete.", kind="info"))
-                self.after(0, self._enable_open_folder_link)
-            else:
-                summary = f"Batch complete: {successes} succeeded"
-                if failures:
-                    summary += f", {failures} failed"
-                self._log(f"\n{summary}.")
-                kind = "info" if failures == 0 else "error"
-                self.after(0, lambda: self._set_status(f"{summary}.", kind=kind))
-                self.after(0, self._enable_open_folder_link)
-
-        finally:
-            self._cancel_requested = False
-            pdf_password = None  # type: ignore[assignment]
-            self.after(0, lambda: self._lock_ui(busy=False))
+        # The child flushes its queue before exiting, so one more drain picks
+        # up whatever arrived since the last tick.
+        self._drain_events()
+        self._flush_log()
+        worker.join()
+        self._worker = None
+        if not self._worker_finished:
+            # Crashed or killed before it could report back.
+            self._log(f"Conversion process exited unexpectedly (code {worker.exitcode}).")
+            self._set_status("Conversion failed. See log for details.", kind="error")
+            self._lock_ui(busy=False)
+
+    def _drain_events(self) -> None:
+        events = self._events
+        if events is None:
+            return
+        # Progress is coalesced: only the newest value in a drain reaches the
+        # bar, so a fast multi-hundred-page run costs one Tk call per tick.
+        pct = None
+        while True:
+            try:
+                event = events.get_nowait()
+            except queue.Empty:
+                break
+            kind, args = event[0], event[1:]
+            if kind == "log":
+                self._log(args[0])
+            elif kind == "progress":
+                pct = args[0]
+            elif kind == "status":
+                self._set_status(args[0], kind=args[1])
+            elif kind == "open_folder":
+                if args[0]:
+                    self._enable_open_folder_link()
+                else:
+                    self._disable_open_folder_link()
+            elif kind == "error":
+                messagebox.showerror("Conversion failed", args[0], parent=self)
+            elif kind == "succeeded":
+                pending = self._pending_fingerprint
+                if pending is not None and str(pending[1]) == args[0]:
+                    self._conv_cache.remember(*pending)
+            elif kind == "finished":
+                self._worker_finished = True
+                self._lock_ui(busy=False)
+        if pct is not None:
+            self._set_pbar_value(pct)
 
     # -------------------------------------------------------------- callbacks
     def _log(self, msg: str) -> None:
-        """Thread-safe log appender."""
-        def append() -> None:
-            self.log_txt.configure(state="normal")
-            self.log_txt.insert("end", str(msg) + "\n")
-            self.log_txt.see("end")
-            self.log_txt.configure(state="disabled")
+        """Log appender.
 
-        self.after(0, append)
+        Lines are queued and written to the panel in one batch by
+        _flush_log, so a noisy pipeline costs one Text insert per flush
+        instead of one per line.
+        """
+        self._log_queue.append(str(msg))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        # Clear the flag before draining: a line queued mid-drain schedules
+        # another flush instead of being stranded.
+        self._log_flush_pending = False
+        if not self.log_txt.winfo_viewable():
+            # Minimised or withdrawn: keep lines queued; _on_map catches up.
+            return
+        if not self._log_queue:
+            return
+        # Only the Tk thread touches the queue (worker output arrives via
+        # _pump), so a snapshot-and-clear can't lose lines.
+        lines = list(self._log_queue)
+        self._log_queue.clear()
 
-    def _progress_cb(self, done: int, total: int) -> None:
         try:
-            pct = int((done / total) * 100) if total > 0 else 0
-        except Exception:
-            pct = max(0, min(100, done))
-        self.after(0, lambda: self.pbar.configure(value=pct))
+            # Follow new output only if the user hasn't scrolled up to read.
+            at_bottom = self.log_txt.yview()[1] >= 0.999
+            self.log_txt.insert("end", "\n".join(lines) + "\n")
+            self._trim_log()
+            if at_bottom:
+                self.log_txt.see("end")
+        except tk.TclError:
+            # The window was destroyed while a flush was pending.
+            pass
+
+    def _on_map(self, event) -> None:
+        # <Map> on the toplevel also fires for every child; react to ours only.
+        if event.widget is self and self._log_queue:
+            self.after_idle(self._flush_log)
+
+    def _trim_log(self) -> None:
+        """Keep the panel under MAX_LOG_LINES by dropping the oldest lines."""
+        # "end-1c" sits on the empty line after the last newline.
+        lines = int(self.log_txt.index("end-1c").split(".")[0]) - 1
+        if lines > MAX_LOG_LINES:
+            self.log_txt.delete("1.0", f"{lines - LOG_TRIM_TO + 1}.0")
+
+    def _set_pbar_value(self, pct: int) -> None:
+        self.pbar.configure(value=pct)
 
     def _lock_ui(self, busy: bool) -> None:
         if busy:
@@ -1162,7 +1782,7 @@ class PdfMdApp(tk.Tk):
     def _on_cancel(self) -> None:
         if self._worker is None or not self._worker.is_alive():
             return
-        self._cancel_requested = True
+        self._cancel_evt.set()
         self._set_status("Cancelling…", kind="info")
         self._log("Cancellation requested; finishing current step…")
 
@@ -1170,10 +1790,11 @@ class PdfMdApp(tk.Tk):
         path = self._last_output_path or self.out_path_var.get().strip()
         if not path:
             return
+        # Single-input runs record the .md file; batches record a folder.
         folder = Path(path)
-        if folder.is_file():
+        if not folder.is_dir():
             folder = folder.parent
-        if not folder.exists():
+        if not folder.is_dir():
             messagebox.showerror(
                 "Folder not found",
                 f"Output folder does not exist:\n{os_display_path(str(folder))}",
@@ -1182,12 +1803,7 @@ class PdfMdApp(tk.Tk):
             return
 
         try:
-            if platform.system() == "Windows":
-                os.startfile(str(folder))  # type: ignore[attr-defined]
-            elif platform.system() == "Darwin":
-                subprocess.Popen(["open", str(folder)])
-            else:
-                subprocess.Popen(["xdg-open", str(folder)])
+            _OPEN_FOLDER(str(folder))
         except Exception as e:
             messagebox.showerror(
                 "Could not open folder",
@@ -1204,47 +1820,38 @@ class PdfMdApp(tk.Tk):
                 parent=self,
             ):
                 return
-            self._cancel_requested = True
-        self._save_config()
+            self._cancel_evt.set()
+        # The window is going away: write now instead of waiting for the timer.
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._do_save()
         self.destroy()
 
     # ---------------------------------------------------------- options helpers
     def _options_from_controls(self) -> dict:
-        return {
-            "ocr_mode": self.ocr_var.get(),
-            "ocr_lang": self.ocr_lang_var.get().strip() or "eng",
-            "preview": bool(self.preview_var.get()),
-            "export_images": bool(self.export_images_var.get()),
-            "page_breaks": bool(self.page_breaks_var.get()),
-            "rm_edges": bool(self.rm_edges_var.get()),
-            "caps_to_headings": bool(self.caps_to_headings_var.get()),
-            "defrag": bool(self.defrag_var.get()),
-            "heading_ratio": float(self.heading_ratio_var.get()),
-            "orphan_len": int(self.orphan_len_var.get()),
-        }
+        opts = {}
+        for key, var, _field, conv in self._opt_specs:
+            try:
+                raw = var.get()
+            except tk.TclError:  # e.g. a spinbox holding non-numeric text
+                raw = DEFAULT_OPTIONS[key]
+            opts[key] = _coerce_option(key, conv, raw)
+        return opts
 
-    def _apply_options_dict(self, opts: dict) -> None:
-        o = {**DEFAULT_OPTIONS, **opts}
-        if o["ocr_mode"] not in OCR_CHOICES:
-            o["ocr_mode"] = OCR_CHOICES[0]
-        self.ocr_var.set(o["ocr_mode"])
-        self.ocr_lang_var.set(str(o.get("ocr_lang", "eng")) or "eng")
-        self.preview_var.set(bool(o["preview"]))
-        self.export_images_var.set(bool(o["export_images"]))
-        self.page_breaks_var.set(bool(o["page_breaks"]))
-        self.rm_edges_var.set(bool(o["rm_edges"]))
-        self.caps_to_headings_var.set(bool(o["caps_to_headings"]))
-        self.defrag_var.set(bool(o["defrag"]))
-        try:
-            self.heading_ratio_var.set(float(o["heading_ratio"]))
-        except Exception:
-            self.heading_ratio_var.set(DEFAULT_OPTIONS["heading_ratio"])
-        try:
-            self.orphan_len_var.set(int(o["orphan_len"]))
-        except Exception:
-            self.orphan_len_var.set(DEFAULT_OPTIONS["orphan_len"])
+    def _build_options(self) -> Options:
+        """Return an Options snapshot of the current control values."""
+        opts = self._options_from_controls()
+        return Options(**{
+            field: opts[key] for key, _var, field, _conv in self._opt_specs
+        })
+
+    def _apply_options_dict(self, opts: Mapping[str, object]) -> None:
+        for key, var, _field, conv in self._opt_specs:
+            value = _coerce_option(key, conv, opts.get(key, DEFAULT_OPTIONS[key]))
+            _set_if_changed(var, value)
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = PdfMdApp()
     app.mainloop()
\ No newline at end of file
@@ -19,6 +19,7 @@ import argparse
 import getpass
 import os
 import re
+import stat
 import sys
 import time
 import traceback
@@ -30,6 +31,15 @@ from .models import Options
 from .pipeline import pdf_to_markdown
 
 
+# Error messages that mean "ask for a password and retry" (see
+# extract._open_pdf_with_password, which keeps its messages matchable).
+_PASSWORD_RE = re.compile(
+    r"password required|password is required|incorrect pdf password"
+    r"|wrong password|cannot decrypt|encrypted",
+    re.IGNORECASE,
+)
+
+
 # ---------------------------------------------------------------------------
 # Colour handling
 # ---------------------------------------------------------------------------
@@ -165,6 +175,12 @@ Security notes:
         help="Export images to an _assets/ folder and append Markdown references.",
     )
 
+    parser.add_argument(
+        "--no-image-cache",
+        action="store_true",
+        help="Re-export images even if the _assets/ folder is current for this PDF.",
+    )
+
     parser.add_argument(
         "--page-breaks",
         action="store_true",
@@ -238,6 +254,7 @@ def _make_options(args: argparse.Namespace) -> Options:
     # Rendering / output
     opts.insert_page_breaks = bool(args.page_breaks)
     opts.export_images = bool(args.export_images)
+    opts.image_cache = not args.no_image_cache
 
     # Transform heuristics remain at their defaults; they can be exposed later.
     return opts
@@ -248,14 +265,21 @@ def _make_options(args: argparse.Namespace) -> Options:
 # ---------------------------------------------------------------------------
 
 
+_BAR_WIDTH = 24
+# Every possible bar, indexed by the number of filled cells.
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+
 def _make_progress_cb(
     file_label: str,
     colors: _Colors,
     args: argparse.Namespace,
 ) -> Callable[[int, int], None]:
     start = time.time()
+    last_pct = -1
 
     def progress_cb(done: int, total: int) -> None:
+        nonlocal last_pct
         if args.no_progress or args.quiet:
             return
 
@@ -265,6 +289,10 @@ def _make_progress_cb(
         else:
             pct = int(done * 100 / total) if total > 0 else 0
         pct = max(0, min(100, pct))
+        # Nothing visible changes until the percentage does.
+        if pct == last_pct:
+            return
+        last_pct = pct
 
         elapsed = time.time() - start
         eta_str = "ETA: --"
@@ -275,9 +303,7 @@ def _make_progress_cb(
             else:
                 eta_str = f"ETA: {int(remaining // 60)}m"
 
-        bar_width = 24
-        filled = int(bar_width * pct / 100)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        bar = _BARS[int(_BAR_WIDTH * pct / 100)]
 
         line = f"\r{colors.info}[{bar}] {pct:3d}% {eta_str}  {file_label}{colors.reset}"
         sys.stderr.write(line)
@@ -380,15 +406,9 @@ def _run_single(
 ) -> bool:
     """Run conversion for one input/output pair.
 
-    Returns True on success, False on failure.
+    Returns True on success, False on failure. *inp* must already have been
+    checked to be a regular file (main() does this).
     """
-    if not inp.is_file():
-        if not args.quiet:
-            sys.stderr.write(
-                f"{colors.err}Error:{colors.reset} input file not found: {inp}\n"
-            )
-        return False
-
     if not args.quiet:
         sys.stderr.write(
             f"{colors.info}Converting{colors.reset} {inp} "
@@ -426,16 +446,7 @@ def _run_single(
 
     except Exception as exc:
         # Look for password / encryption related errors
-        lower = str(exc).lower()
-        password_keywords = [
-            "password required",
-            "password is required",
-            "incorrect pdf password",
-            "wrong password",
-            "cannot decrypt",
-            "encrypted",
-        ]
-        needs_password = any(kw in lower for kw in password_keywords)
+        needs_password = bool(_PASSWORD_RE.search(str(exc)))
 
         if not needs_password:
             if not args.quiet:
@@ -549,7 +560,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     failures = 0
 
     for inp in inputs:
-        if not inp.is_file():
+        # One stat() per input; _run_single relies on this check.
+        try:
+            is_file = stat.S_ISREG(os.stat(inp).st_mode)
+        except OSError:
+            is_file = False
+        if not is_file:
             if not args.quiet:
                 sys.stderr.write(
                     f"{colors.err}Error:{colors.reset} input file not found: {inp}\n"
@@ -228,7 +228,7 @@ _MATH_PARENS = set("()[]{}")
 
 def _line_text(line: Line) -> str:
     """Join spans into a raw line string."""
-    return "".join(sp.text or "" for sp in line.spans).rstrip("\n")
+    return line.text().rstrip("\n")
 
 
 def _normalize_unicode_math(text: str) -> str:
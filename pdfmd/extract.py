@@ -138,10 +138,15 @@ def extract_pages(
     options: Options,
     progress_cb: DefProgress = None,
     pdf_password: Optional[str] = None,
+    doc=None,
 ) -> List[PageText]:
     """Extract pages as PageText according to OCR mode and preview flag.
 
     progress_cb, if provided, is called as (done_pages, total_pages).
+
+    doc, if provided, is the already-opened (and authenticated) document for
+    pdf_path. It is read but not closed, so the caller can reuse it for
+    later stages; otherwise each extraction path opens its own.
     """
     if fitz is None:
         raise RuntimeError("PyMuPDF (fitz) is not installed. Install with: pip install pymupdf")
@@ -149,14 +154,14 @@ def extract_pages(
     mode = (options.ocr_mode or "off").lower()
 
     if mode == "off":
-        return _extract_native(pdf_path, options, progress_cb, pdf_password)
+        return _extract_native(pdf_path, options, progress_cb, pdf_password, doc)
 
     if mode == "auto":
-        if _needs_ocr_probe(pdf_path, pdf_password):
+        if _needs_ocr_probe(pdf_path, pdf_password, doc=doc):
             log("[extract] Auto: scanned PDF detected.")
             if _HAS_TESS and _HAS_PIL and _tesseract_available():
                 log("[extract] Using Tesseract OCR...")
-                return _extract_tesseract(pdf_path, options, progress_cb, pdf_password)
+                return _extract_tesseract(pdf_path, options, progress_cb, pdf_password, doc)
             elif _which("ocrmypdf") and _tesseract_available():
                 log("[extract] Using OCRmyPDF...")
                 return _extract_ocrmypdf_then_native(pdf_path, options, progress_cb, pdf_password)
@@ -165,9 +170,9 @@ def extract_pages(
                 log("[extract] Install Tesseract from: https://github.com/UB-Mannheim/tesseract/wiki")
                 log("[extract] Then run: pip install pytesseract pillow")
                 log("[extract] Falling back to native extraction (may produce poor results).")
-                return _extract_native(pdf_path, options, progress_cb, pdf_password)
+                return _extract_native(pdf_path, options, progress_cb, pdf_password, doc)
         # Otherwise, native path
-        return _extract_native(pdf_path, options, progress_cb, pdf_password)
+        return _extract_native(pdf_path, options, progress_cb, pdf_password, doc)
 
     if mode == "tesseract":
         if not (_HAS_TESS and _HAS_PIL):
@@ -181,7 +186,7 @@ def extract_pages(
                 "OCR mode 'tesseract' selected but Tesseract binary is not available on PATH.\n"
                 "Install Tesseract from: https://github.com/UB-Mannheim/tesseract/wiki"
             )
-        return _extract_tesseract(pdf_path, options, progress_cb, pdf_password)
+        return _extract_tesseract(pdf_path, options, progress_cb, pdf_password, doc)
 
     if mode == "ocrmypdf":
         if not _tesseract_available():
@@ -207,9 +212,12 @@ def _extract_native(
     options: Options,
     progress_cb: DefProgress,
     pdf_password: Optional[str] = None,
+    doc=None,
 ) -> List[PageText]:
     """Extract text using PyMuPDF's native text extraction."""
-    doc = _open_pdf_with_password(pdf_path, pdf_password)
+    own_doc = doc is None
+    if own_doc:
+        doc = _open_pdf_with_password(pdf_path, pdf_password)
     try:
         total = doc.page_count
 
@@ -229,7 +237,8 @@ def _extract_native(
 
         return out
     finally:
-        doc.close()
+        if own_doc:
+            doc.close()
 
 
 # ------------------------ Tesseract-based OCR path -----------------------
@@ -240,12 +249,15 @@ def _extract_tesseract(
     options: Options,
     progress_cb: DefProgress,
     pdf_password: Optional[str] = None,
+    doc=None,
 ) -> List[PageText]:
     """Render each page to an image, feed into Tesseract, build PageText."""
     if not (_HAS_TESS and _HAS_PIL):  # pragma: no cover - guarded earlier
         raise RuntimeError("Tesseract/Pillow not available")
 
-    doc = _open_pdf_with_password(pdf_path, pdf_password)
+    own_doc = doc is None
+    if own_doc:
+        doc = _open_pdf_with_password(pdf_path, pdf_password)
     try:
         total = doc.page_count
 
@@ -282,7 +294,8 @@ def _extract_tesseract(
 
         return out
     finally:
-        doc.close()
+        if own_doc:
+            doc.close()
 
 
 # ------------------------ OCRmyPDF + native path -------------------------
@@ -359,6 +372,7 @@ def _needs_ocr_probe(
     pdf_path: str,
     pdf_password: Optional[str] = None,
     pages_to_check: int = 3,
+    doc=None,
 ) -> bool:
     """Heuristic: determine if PDF is likely scanned and needs OCR.
 
@@ -367,10 +381,12 @@ def _needs_ocr_probe(
       2. Presence of large images covering most of the page area
       3. Low text density relative to page size
     """
-    try:
-        doc = _open_pdf_with_password(pdf_path, pdf_password)
-    except Exception:
-        return False
+    own_doc = doc is None
+    if own_doc:
+        try:
+            doc = _open_pdf_with_password(pdf_path, pdf_password)
+        except Exception:
+            return False
 
     try:
         if doc.page_count == 0:
@@ -415,7 +431,8 @@ def _needs_ocr_probe(
 
         return False
     finally:
-        doc.close()
+        if own_doc:
+            doc.close()
 
 
 def _tesseract_available() -> bool:
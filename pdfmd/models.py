@@ -37,7 +37,13 @@ class Line:
     spans: List[Span] = field(default_factory=list)
 
     def text(self) -> str:
-        return "".join(s.text for s in self.spans)
+        # Pipeline stages replace lines rather than editing their spans, so
+        # the joined text is computed once and kept for every later stage.
+        joined = self.__dict__.get("_joined")
+        if joined is None:
+            joined = "".join(s.text or "" for s in self.spans)
+            self.__dict__["_joined"] = joined
+        return joined
 
 
 @dataclass
@@ -45,9 +51,12 @@ class Block:
     lines: List[Line] = field(default_factory=list)
 
     def is_empty(self) -> bool:
+        # isspace() answers the same question as strip() without building a
+        # new string per span; "".isspace() is False, hence the truth test.
         for ln in self.lines:
-            if any(sp.text.strip() for sp in ln.spans):
-                return False
+            for sp in ln.spans:
+                if sp.text and not sp.text.isspace():
+                    return False
         return True
 
 
@@ -173,6 +182,8 @@ class Options:
     # Rendering / output
     insert_page_breaks: bool = False
     export_images: bool = False
+    # Reuse a previous image export for an unchanged PDF.
+    image_cache: bool = True
 
 
 # ------------------------------ Utilities ------------------------------
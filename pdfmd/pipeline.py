@@ -12,8 +12,9 @@ Stages:
     4) Optional: export images to _assets/ and append simple references
 
 Notes:
-    - `progress_cb` receives (done, total) at a few milestones; GUI can map this
-      to a determinate bar.
+    - `progress_cb` receives (done, total) per page within the extract,
+      transform and render stages and at each stage boundary; GUI can map
+      this to a determinate bar, and raising from it cancels the run.
     - Image references use forward slashes in Markdown (portable across OSes),
       while all file I/O uses Path/os to be cross-platform safe.
     - Password handling is secure: never logged, never persisted, only used in-memory.
@@ -21,8 +22,12 @@ Notes:
 """
 from __future__ import annotations
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional, List, Dict
+import hashlib
+import json
 import os
 
 try:
@@ -40,6 +45,19 @@ from .utils import log as default_log
 DefProgress = Optional[Callable[[int, int], None]]
 DefLogger = Optional[Callable[[str], None]]
 
+# Threads writing exported images; the work is disk-bound, not CPU-bound.
+_IMAGE_WRITE_WORKERS = 4
+# Pages per image-export shard; MuPDF's resource store is emptied between shards.
+_IMAGE_SHARD_PAGES = 200
+
+# Records which PDF produced an _assets folder, so unchanged inputs skip
+# re-export (see Options.image_cache).
+_IMAGE_MANIFEST = ".pdfmd-images.json"
+_IMAGE_KEY_PREFIX_BYTES = 1 << 20
+
+# Characters per slice when writing the Markdown output.
+_WRITE_CHUNK_CHARS = 1 << 20
+
 
 def _append_image_refs(md: str, page_to_relpaths: Dict[int, List[str]]) -> str:
     """Append image references to the end of the Markdown document.
@@ -54,18 +72,62 @@ def _append_image_refs(md: str, page_to_relpaths: Dict[int, List[str]]) -> str:
     if not page_to_relpaths:
         return md
     
-    lines: List[str] = [md.rstrip(), ""]
+    refs: List[str] = []
     
     for pno in sorted(page_to_relpaths):
         paths = page_to_relpaths[pno]
         if not paths:
             continue
-        lines.append(f"**Images from page {pno + 1}:**")
+        refs.append(f"**Images from page {pno + 1}:**")
         for i, rel in enumerate(paths, start=1):
-            lines.append(f"- ![p{pno + 1}-{i}]({rel})")
-        lines.append("")
+            refs.append(f"- ![p{pno + 1}-{i}]({rel})")
+        refs.append("")
     
-    return "\n".join(lines).rstrip() + "\n"
+    # Join and trim only the (small) reference section; the document body
+    # is copied once, by the final concatenation.
+    if not refs:
+        return md.rstrip() + "\n"
+    return md.rstrip() + "\n\n" + "\n".join(refs).rstrip() + "\n"
+
+
+def _image_cache_key(pdf_path: str, preview_only: bool) -> str:
+    """Cheap identity for a PDF's exported images.
+
+    Size, mtime and a digest of the first MiB catch any realistic edit
+    without reading the whole file.
+    """
+    st = os.stat(pdf_path)
+    h = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, "rb") as fh:
+        h.update(fh.read(_IMAGE_KEY_PREFIX_BYTES))
+    h.update(f"{st.st_size}:{st.st_mtime_ns}:{int(preview_only)}".encode("ascii"))
+    return h.hexdigest()
+
+
+def _load_image_manifest(assets_dir: Path, key: str) -> Optional[Dict[int, List[str]]]:
+    """Return the recorded export mapping if it matches *key* and every file exists."""
+    try:
+        data = json.loads((assets_dir / _IMAGE_MANIFEST).read_text(encoding="utf-8"))
+        if data.get("key") != key:
+            return None
+        mapping = {int(pno): [str(rel) for rel in rels] for pno, rels in data["pages"].items()}
+    except Exception:
+        return None
+
+    parent = assets_dir.parent
+    for rels in mapping.values():
+        for rel in rels:
+            if not (parent / rel).is_file():
+                return None
+    return mapping
+
+
+def _save_image_manifest(assets_dir: Path, key: str, mapping: Dict[int, List[str]]) -> None:
+    data = {"key": key, "pages": {str(pno): rels for pno, rels in mapping.items()}}
+    try:
+        (assets_dir / _IMAGE_MANIFEST).write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        pass  # the cache is an optimisation; a missing manifest just means re-export
 
 
 def _export_images(
@@ -74,6 +136,7 @@ def _export_images(
     options: Options,
     log_cb: DefLogger = None,
     pdf_password: Optional[str] = None,
+    doc=None,
 ) -> Dict[int, List[str]]:
     """Export images to an _assets folder next to output_md and return relative paths.
 
@@ -88,6 +151,8 @@ def _export_images(
         options: Conversion options
         log_cb: Optional logging callback
         pdf_password: Optional PDF password (ephemeral, in-memory only)
+        doc: Optional already-open document for pdf_path; used as-is and
+            left open for the caller to close
         
     Returns:
         Dictionary mapping page indices to lists of relative image paths
@@ -100,70 +165,124 @@ def _export_images(
             log_cb("[pipeline] PyMuPDF is not available; cannot export images.")
         return {}
 
-    try:
-        # Reuse the central password-aware open helper so behavior matches extract.py
-        doc = _open_pdf_with_password(pdf_path, pdf_password)
-    except Exception as e:
-        if log_cb:
-            log_cb(f"[pipeline] Could not export images: {e}")
-        return {}
+    out_path = Path(output_md)
+    assets_dir = out_path.with_name(out_path.stem + "_assets")
+
+    cache_key = None
+    if options.image_cache:
+        try:
+            cache_key = _image_cache_key(pdf_path, options.preview_only)
+        except OSError:
+            cache_key = None
+    if cache_key is not None:
+        cached = _load_image_manifest(assets_dir, cache_key)
+        if cached is not None:
+            if log_cb and cached:
+                log_cb(f"[pipeline] Reusing exported images in folder: {assets_dir}")
+            return cached
+
+    own_doc = doc is None
+    if own_doc:
+        try:
+            # Reuse the central password-aware open helper so behavior matches extract.py
+            doc = _open_pdf_with_password(pdf_path, pdf_password)
+        except Exception as e:
+            if log_cb:
+                log_cb(f"[pipeline] Could not export images: {e}")
+            return {}
 
     try:
-        out_path = Path(output_md)
-        assets_dir = out_path.with_name(out_path.stem + "_assets")
         assets_dir.mkdir(parents=True, exist_ok=True)
 
-        mapping: Dict[int, List[str]] = {}
         page_count = doc.page_count
         limit = page_count if not options.preview_only else min(3, page_count)
 
-        for pno in range(limit):
-            page = doc.load_page(pno)
-            images = page.get_images(full=True)
-            rels: List[str] = []
-            
-            for idx, img in enumerate(images, start=1):
-                xref = img[0]
-                try:
-                    pix = fitz.Pixmap(doc, xref)
-                except Exception as exc:
-                    if log_cb:
-                        log_cb(f"[pipeline] Skipping image xref={xref} on page {pno + 1}: {exc}")
-                    continue
-                
-                # Convert any non-RGB/Gray colorspace (CMYK, ICC, etc.) to RGB.
-                # PNG only supports RGB(A) and Gray(A), so anything else must
-                # be converted before saving.
-                if pix.colorspace and pix.colorspace.n > 3:
-                    pix = fitz.Pixmap(fitz.csRGB, pix)
-                
-                # Drop alpha channel if present — avoids issues with some
-                # viewers and keeps file sizes smaller.
-                if pix.alpha:
-                    pix = fitz.Pixmap(pix, 0)  # 0 = drop alpha
-                
-                fname = assets_dir / f"img_{pno + 1:03d}_{idx:02d}.png"
-                try:
-                    pix.save(str(fname))
-                except Exception as exc:
-                    if log_cb:
-                        log_cb(f"[pipeline] Could not save image p{pno + 1}-{idx}: {exc}")
-                    continue
-                
-                # Markdown wants forward slashes for portability
-                rel = assets_dir.name + "/" + fname.name
-                rels.append(rel)
-            
-            if rels:
-                mapping[pno] = rels
-        
+        page_images = [doc.load_page(pno).get_images(full=True) for pno in range(limit)]
+
+        # Logos and backgrounds often repeat on every page: keep the PNG bytes
+        # of a repeated xref only until its last use instead of re-encoding.
+        uses_left = Counter(img[0] for images in page_images for img in images)
+        png_by_xref: Dict[int, bytes] = {}
+        pending: List[tuple] = []  # (pno, idx, fname, future)
+
+        # MuPDF is not thread-safe, so decoding and PNG encoding stay on this
+        # thread; only the file writes go to the pool and overlap with the
+        # next image's encode.
+        with ThreadPoolExecutor(max_workers=_IMAGE_WRITE_WORKERS) as pool:
+            for pno, images in enumerate(page_images):
+                if pno and pno % _IMAGE_SHARD_PAGES == 0:
+                    # MuPDF keeps decoded images in its resource store; empty
+                    # it between shards so long image-heavy documents do not
+                    # grow towards the store limit.
+                    fitz.TOOLS.store_shrink(100)
+
+                for idx, img in enumerate(images, start=1):
+                    xref = img[0]
+                    uses_left[xref] -= 1
+                    fname = assets_dir / f"img_{pno + 1:03d}_{idx:02d}.png"
+                    data = (
+                        png_by_xref.get(xref)
+                        if uses_left[xref] > 0
+                        else png_by_xref.pop(xref, None)
+                    )
+                    if data is None:
+                        try:
+                            pix = fitz.Pixmap(doc, xref)
+                        except Exception as exc:
+                            if log_cb:
+                                log_cb(
+                                    f"[pipeline] Skipping image xref={xref} "
+                                    f"on page {pno + 1}: {exc}"
+                                )
+                            continue
+
+                        # Convert any non-RGB/Gray colorspace (CMYK, ICC, etc.) to RGB.
+                        # PNG only supports RGB(A) and Gray(A), so anything else must
+                        # be converted before saving.
+                        if pix.colorspace and pix.colorspace.n > 3:
+                            pix = fitz.Pixmap(fitz.csRGB, pix)
+
+                        # Drop alpha channel if present — avoids issues with some
+                        # viewers and keeps file sizes smaller.
+                        if pix.alpha:
+                            pix = fitz.Pixmap(pix, 0)  # 0 = drop alpha
+
+                        try:
+                            data = pix.tobytes("png")
+                        except Exception as exc:
+                            if log_cb:
+                                log_cb(f"[pipeline] Could not save image p{pno + 1}-{idx}: {exc}")
+                            continue
+                        finally:
+                            pix = None  # free the raster before the next decode
+                        if uses_left[xref] > 0:
+                            png_by_xref[xref] = data
+
+                    pending.append((pno, idx, fname, pool.submit(fname.write_bytes, data)))
+
+        mapping: Dict[int, List[str]] = {}
+        for pno, idx, fname, fut in pending:
+            try:
+                fut.result()
+            except Exception as exc:
+                if log_cb:
+                    log_cb(f"[pipeline] Could not save image p{pno + 1}-{idx}: {exc}")
+                continue
+
+            # Markdown wants forward slashes for portability
+            mapping.setdefault(pno, []).append(assets_dir.name + "/" + fname.name)
+
         if log_cb and mapping:
             log_cb(f"[pipeline] Exported images to folder: {assets_dir}")
+
+        if cache_key is not None:
+            _save_image_manifest(assets_dir, cache_key, mapping)
         
         return mapping
     
     finally:
-        doc.close()
+        if own_doc:
+            doc.close()
 
 
 def pdf_to_markdown(
@@ -214,69 +333,94 @@ def pdf_to_markdown(
     if log_cb:
         log_cb("[pipeline] Extracting text…")
 
-    # Map page-level progress into the [0, 30] range of a 0 to 100 scale.
-    def _stage1_progress(done_pages: int, total_pages: int) -> None:
-        if progress_cb and total_pages > 0:
-            pct = int(done_pages * 30 / total_pages)
-            progress_cb(pct, 100)
+    # Open (and authenticate) once; extraction and image export share the
+    # document instead of each re-parsing the file and re-checking the password.
+    doc = _open_pdf_with_password(input_pdf, pdf_password)
+    try:
+        # Map page-level progress into the [0, 30] range of a 0 to 100 scale.
+        def _stage1_progress(done_pages: int, total_pages: int) -> None:
+            if progress_cb and total_pages > 0:
+                pct = int(done_pages * 30 / total_pages)
+                progress_cb(pct, 100)
 
-    pages = extract_pages(
-        input_pdf,
-        options,
-        progress_cb=_stage1_progress,
-        pdf_password=pdf_password,
-    )
+        pages = extract_pages(
+            input_pdf,
+            options,
+            progress_cb=_stage1_progress,
+            pdf_password=pdf_password,
+            doc=doc,
+        )
 
-    if not pages:
-        raise ValueError("PDF extraction produced no pages")
+        if not pages:
+            raise ValueError("PDF extraction produced no pages")
 
-    if progress_cb:
-        progress_cb(30, 100)
+        if progress_cb:
+            progress_cb(30, 100)
 
-    # --- Stage 2: Transform ---
-    if log_cb:
-        log_cb("[pipeline] Transforming pages…")
+        # --- Stage 2: Transform ---
+        if log_cb:
+            log_cb("[pipeline] Transforming pages…")
     
-    pages_t, header, footer, body_sizes = transform_pages(
-        pages, 
-        options,
-        debug_tables=debug_tables,
-    )
+        # Per-page progress in the later stages doubles as a cancellation point
+        # for callers whose progress_cb raises (the GUI does).
+        def _stage2_progress(done_pages: int, total_pages: int) -> None:
+            if progress_cb and total_pages > 0:
+                progress_cb(30 + int(done_pages * 30 / total_pages), 100)
+
+        pages_t, header, footer, body_sizes = transform_pages(
+            pages,
+            options,
+            debug_tables=debug_tables,
+            progress_cb=_stage2_progress,
+        )
     
-    if log_cb and (header or footer):
-        log_cb(f"[pipeline] Removed repeating edges → header={header!r}, footer={footer!r}")
+        if log_cb and (header or footer):
+            log_cb(f"[pipeline] Removed repeating edges → header={header!r}, footer={footer!r}")
 
-    if progress_cb:
-        progress_cb(60, 100)
+        if progress_cb:
+            progress_cb(60, 100)
 
-    # --- Stage 3: Render ---
-    if log_cb:
-        log_cb("[pipeline] Rendering Markdown…")
+        # --- Stage 3: Render ---
+        if log_cb:
+            log_cb("[pipeline] Rendering Markdown…")
     
-    md = render_document(
-        pages_t,
-        options,
-        body_sizes=body_sizes,
-    )
+        def _stage3_progress(done_pages: int, total_pages: int) -> None:
+            if progress_cb and total_pages > 0:
+                progress_cb(60 + int(done_pages * 20 / total_pages), 100)
 
-    if progress_cb:
-        progress_cb(80, 100)
-
-    # --- Stage 4: Optional image export ---
-    if options.export_images:
-        if log_cb:
-            log_cb("[pipeline] Exporting images…")
-        
-        page_to_rel = _export_images(
-            input_pdf,
-            output_md,
+        md = render_document(
+            pages_t,
             options,
-            log_cb=log_cb,
-            pdf_password=pdf_password,
+            body_sizes=body_sizes,
+            progress_cb=_stage3_progress,
         )
+
+        # Only the Markdown string is needed from here on. Release the page
+        # models (spans, blocks, table grids) so image export and the write
+        # do not run with the whole extracted document still resident.
+        del pages, pages_t
+
+        if progress_cb:
+            progress_cb(80, 100)
+
+        # --- Stage 4: Optional image export ---
+        if options.export_images:
+            if log_cb:
+                log_cb("[pipeline] Exporting images…")
         
-        if page_to_rel:
-            md = _append_image_refs(md, page_to_rel)
+            page_to_rel = _export_images(
+                input_pdf,
+                output_md,
+                options,
+                log_cb=log_cb,
+                pdf_password=pdf_password,
+                doc=doc,
+            )
+
+            if page_to_rel:
+                md = _append_image_refs(md, page_to_rel)
+    finally:
+        doc.close()
 
     if progress_cb:
         progress_cb(90, 100)
@@ -286,7 +430,11 @@ def pdf_to_markdown(
         log_cb("[pipeline] Writing output file…")
     
     try:
-        Path(output_md).write_text(md, encoding="utf-8")
+        # Encode in slices: write_text would build the whole UTF-8 bytes
+        # object, as large again as the document, before writing it.
+        with open(output_md, "w", encoding="utf-8") as fh:
+            for i in range(0, len(md), _WRITE_CHUNK_CHARS):
+                fh.write(md[i:i + _WRITE_CHUNK_CHARS])
     except Exception as e:
         if log_cb:
             log_cb(f"[pipeline] Error writing output: {e}")
@@ -17,10 +17,9 @@ Key behaviours:
 from __future__ import annotations
 
 import re
-from statistics import median
 from typing import Callable, List, Optional
 
-from .models import Block, Line, PageText, Options
+from .models import Block, Line, PageText, Options, median_safe
 from .utils import normalize_punctuation, linkify_urls, escape_markdown
 from .transform import is_all_caps_line, is_mostly_caps
 
@@ -55,6 +54,8 @@ def _wrap_inline(text: str, bold: bool, italic: bool) -> str:
 # Line / paragraph shaping
 # ---------------------------------------------------------------------------
 
+_HYPHEN_WRAP_PATTERN = re.compile(r"-\n(\s*)")
+
 
 def _fix_hyphenation(text: str) -> str:
     """Repair line-wrap hyphenation.
@@ -64,7 +65,7 @@ def _fix_hyphenation(text: str) -> str:
 
     We only remove hyphen + newline when it is clearly a wrap.
     """
-    return re.sub(r"-\n(\s*)", r"\1", text)
+    return _HYPHEN_WRAP_PATTERN.sub(r"\1", text)
 
 
 def _unwrap_hard_breaks(lines: List[str]) -> str:
@@ -116,30 +117,37 @@ def _defragment_orphans(md: str, max_len: int = 45) -> str:
       then we append it to the previous non-blank line.
     """
     lines = md.splitlines()
+    n = len(lines)
     res: List[str] = []
+    # Index in `res` of the last non-blank line, so orphans attach without
+    # scanning back over blank lines.
+    last = -1
+    prev_blank = False
     i = 0
 
-    while i < len(lines):
+    while i < n:
         line = lines[i]
+        stripped = line.strip()
 
         if (
-            i > 0
-            and i < len(lines) - 1
-            and not lines[i - 1].strip()
+            prev_blank
+            and i < n - 1
+            and 0 < len(stripped) <= max_len
+            and not stripped.startswith("#")
             and not lines[i + 1].strip()
-            and 0 < len(line.strip()) <= max_len
-            and not line.strip().startswith("#")
         ):
             # Attach orphan to the previous non-blank line
-            j = len(res) - 1
-            while j >= 0 and not res[j].strip():
-                j -= 1
-            if j >= 0:
-                res[j] = (res[j].rstrip() + " " + line.strip()).strip()
+            if last >= 0:
+                res[last] = (res[last].rstrip() + " " + stripped).strip()
+                # Skip the blank line that follows; it is the new previous line.
+                prev_blank = True
                 i += 2
                 continue
 
         res.append(line)
+        if stripped:
+            last = len(res) - 1
+        prev_blank = not stripped
         i += 1
 
     return "\n".join(res)
@@ -188,26 +196,38 @@ def _is_footer_noise(text: str) -> bool:
 # List normalisation
 # ---------------------------------------------------------------------------
 
+_BULLET_CHARS = frozenset("•○◦·-–—")
+_BULLET_PREFIX_PATTERN = re.compile(r"[•○◦·\-–—]\s+")
+_NUMBERED_PREFIX_PATTERN = re.compile(r"(\d+)[\.\)]\s+")
+_LETTERED_PREFIX_PATTERN = re.compile(r"[A-Za-z][\.\)]\s+")
+
 
 def _normalize_list_line(ln: str) -> str:
     """Normalize various bullet/numbered prefixes into Markdown list syntax."""
     s = ln.lstrip()
+    # Dispatch on the first character so ordinary prose lines, the vast
+    # majority, never reach the regex engine.
+    c = s[:1]
+    if not c:
+        return ""
+
     # Bullet-like prefixes
-    if re.match(r"^[•○◦·\-–—]\s+", s):
-        s = re.sub(r"^[•○◦·\-–—]\s+", "- ", s)
-        return s
+    if c in _BULLET_CHARS:
+        m = _BULLET_PREFIX_PATTERN.match(s)
+        if m:
+            return "- " + s[m.end():]
 
     # Numbered: "1. text" or "1) text"
-    m_num = re.match(r"^(\d+)[\.\)]\s+", s)
-    if m_num:
-        num = m_num.group(1)
-        s = re.sub(r"^\d+[\.\)]\s+", f"{num}. ", s)
-        return s
+    elif c.isdigit():
+        m = _NUMBERED_PREFIX_PATTERN.match(s)
+        if m:
+            return f"{m.group(1)}. " + s[m.end():]
 
     # Lettered outlines: "A. text" or "a) text" → bullet
-    if re.match(r"^[A-Za-z][\.\)]\s+", s):
-        s = re.sub(r"^[A-Za-z][\.\)]\s+", "- ", s)
-        return s
+    elif c.isascii() and c.isalpha():
+        m = _LETTERED_PREFIX_PATTERN.match(s)
+        if m:
+            return "- " + s[m.end():]
 
     return ln.strip()
 
@@ -352,27 +372,50 @@ def _render_table_block(block: Block) -> List[str]:
 # Block → Markdown lines
 # ---------------------------------------------------------------------------
 
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
+
+def _shape_paragraph(rendered_lines: List[str]) -> str:
+    """Turn rendered block lines into one paragraph of Markdown text.
+
+    Repairs wrap hyphenation, drops footer noise, normalises list prefixes
+    in the same pass, then unwraps, normalises punctuation and linkifies.
+    """
+    lines: List[str] = []
+    for ln in _fix_hyphenation("\n".join(rendered_lines)).splitlines():
+        if not ln.strip():
+            lines.append("")
+        elif not _is_footer_noise(ln):
+            lines.append(_normalize_list_line(ln))
+
+    para = _unwrap_hard_breaks(lines)
+    para = normalize_punctuation(para)
+    return linkify_urls(para)
+
 
 def _block_to_lines(
     block: Block,
     body_size: float,
+    heading_threshold: float,
     caps_to_headings: bool,
-    heading_size_ratio: float,
-) -> List[str]:
-    """Convert a Block into a list of Markdown lines.
+    out: List[str],
+) -> None:
+    """Convert a Block into Markdown lines, appended to `out`.
 
     We build two parallel views:
       - raw_lines: plain text (no Markdown), for heading detection
       - rendered_lines: text with inline styling (bold/italic), for body output
 
     Heading detection uses:
-      - average span font size vs body_size
+      - average span font size vs heading_threshold
+        (body_size * Options.heading_size_ratio, computed once per page)
       - optional ALL-CAPS / MOSTLY-CAPS heuristic across the block
     """
     # Tables: if this block was annotated as a table in transform.py,
     # render it via the table grid and skip paragraph / heading heuristics.
     if getattr(block, "is_table", False) and getattr(block, "table_grid", None) is not None:
-        return _render_table_block(block)
+        out.extend(_render_table_block(block))
+        return
 
     rendered_lines: List[str] = []
     raw_lines: List[str] = []
@@ -417,7 +460,8 @@ def _block_to_lines(
                 texts_raw.append(raw_text)
 
                 esc = escape_markdown(raw_text)
-                esc = _wrap_inline(esc, sp.bold, sp.italic)
+                if sp.bold or sp.italic:
+                    esc = _wrap_inline(esc, sp.bold, sp.italic)
                 texts_fmt.append(esc)
 
                 if getattr(sp, "size", 0.0):
@@ -430,17 +474,18 @@ def _block_to_lines(
             rendered_lines.append(joined_fmt)
             raw_lines.append(joined_raw)
             if sizes:
-                line_sizes.append(median(sizes))
+                # Most lines are a single span; skip the sort for those.
+                line_sizes.append(sizes[0] if len(sizes) == 1 else median_safe(sizes))
 
     if not rendered_lines:
-        return []
+        return
 
-    avg_line_size = median(line_sizes) if line_sizes else body_size
+    avg_line_size = median_safe(line_sizes) if line_sizes else body_size
 
     # Use RAW text (no ** or *) for heading heuristics
     block_text_flat = " ".join(raw_lines).strip()
 
-    heading_by_size = avg_line_size >= body_size * heading_size_ratio
+    heading_by_size = avg_line_size >= heading_threshold
     heading_by_caps = caps_to_headings and (
         is_all_caps_line(block_text_flat) or is_mostly_caps(block_text_flat)
     )
@@ -452,59 +497,28 @@ def _block_to_lines(
         # Heading text: use ONLY the first RAW line, not the formatted one
         heading_raw = raw_lines[0]
         heading_text = escape_markdown(heading_raw)
-        heading_text = re.sub(r"\s+", " ", heading_text).strip(" -:–—")
+        heading_text = _WHITESPACE_RUN_PATTERN.sub(" ", heading_text).strip(" -:–—")
         heading_text = normalize_punctuation(heading_text)
         heading_line = f"{'#' * level} {heading_text}"
 
+        out.append(heading_line)
+        out.append("")
+
         # If there's no additional text, just output heading + blank line
         if len(rendered_lines) == 1:
-            return [heading_line, ""]
+            return
 
         # Otherwise, render remaining lines as normal paragraph/list text
-        tail_text = _fix_hyphenation("\n".join(rendered_lines[1:]))
-
-        lines: List[str] = []
-        for ln in tail_text.splitlines():
-            if not ln.strip():
-                lines.append("")
-                continue
-
-            if _is_footer_noise(ln):
-                continue
-
-            norm = _normalize_list_line(ln)
-            lines.append(norm)
-
-        para = _unwrap_hard_breaks(lines)
-        para = normalize_punctuation(para)
-        para = linkify_urls(para)
-
-        out: List[str] = [heading_line, ""]
+        para = _shape_paragraph(rendered_lines[1:])
         if para.strip():
             out.append(para)
             out.append("")
-        return out
+        return
 
     # ----------------- Normal paragraph path ----------------------------
 
-    para_text = _fix_hyphenation("\n".join(rendered_lines))
-
-    lines: List[str] = []
-    for ln in para_text.splitlines():
-        if not ln.strip():
-            lines.append("")
-            continue
-
-        if _is_footer_noise(ln):
-            continue
-
-        norm = _normalize_list_line(ln)
-        lines.append(norm)
-
-    para = _unwrap_hard_breaks(lines)
-    para = normalize_punctuation(para)
-    para = linkify_urls(para)
-    return [para, ""]
+    out.append(_shape_paragraph(rendered_lines))
+    out.append("")
 
 
 # ---------------------------------------------------------------------------
@@ -513,6 +527,24 @@ def _block_to_lines(
 
 DefProgress = Optional[Callable[[int, int], None]]
 
+_BLANK_RUN_PATTERN = re.compile(r"\n{3,}")
+_TRAILING_DASHES_PATTERN = re.compile(r"\s*-+\s*-+\s*\d*\s*$", re.MULTILINE)
+_SPACE_BEFORE_PUNCT_PATTERN = re.compile(r"\s+([,.;:?!])")
+
+
+def _render_page(page: PageText, body_size: float, options: Options, out: List[str]) -> None:
+    """Append the Markdown lines for one page's blocks to `out`.
+
+    Pages render independently of each other; only the document-level
+    cleanup in render_document looks across page boundaries.
+    """
+    heading_threshold = body_size * options.heading_size_ratio
+    caps_to_headings = options.caps_to_headings
+    for blk in page.blocks:
+        if blk.is_empty():
+            continue
+        _block_to_lines(blk, body_size, heading_threshold, caps_to_headings, out)
+
 
 def render_document(
     pages: List[PageText],
@@ -529,42 +561,33 @@ def render_document(
                     If not provided, the renderer falls back to 11.0.
         progress_cb: optional progress callback (done, total)
     """
+    # Every block appends straight into this one list, which is joined once.
     md_lines: List[str] = []
     total = len(pages)
 
     for i, page in enumerate(pages):
         body = body_sizes[i] if body_sizes and i < len(body_sizes) else 11.0
-
-        for blk in page.blocks:
-            if blk.is_empty():
-                continue
-            md_lines.extend(
-                _block_to_lines(
-                    blk,
-                    body_size=body,
-                    caps_to_headings=options.caps_to_headings,
-                    heading_size_ratio=options.heading_size_ratio,
-                )
-            )
+        _render_page(page, body, options, md_lines)
 
         if options.insert_page_breaks and i < total - 1:
-            md_lines.extend(["---", ""])  # page rule
+            md_lines.append("---")  # page rule
+            md_lines.append("")
 
         if progress_cb:
             progress_cb(i + 1, total)
 
     md = "\n".join(md_lines)
     # Collapse excessive blank lines
-    md = re.sub(r"\n{3,}", "\n\n", md).strip() + "\n"
+    md = _BLANK_RUN_PATTERN.sub("\n\n", md).strip() + "\n"
 
     if options.defragment_short:
         md = _defragment_orphans(md, max_len=options.orphan_max_len)
 
     # Strip common footer artefacts like trailing "- - 1" or "- -" at end of lines
-    md = re.sub(r"\s*-+\s*-+\s*\d*\s*$", "", md, flags=re.MULTILINE)
+    md = _TRAILING_DASHES_PATTERN.sub("", md)
 
     # Tighten spaces before punctuation
-    md = re.sub(r"\s+([,.;:?!])", r"\1", md)
+    md = _SPACE_BEFORE_PUNCT_PATTERN.sub(r"\1", md)
 
     return md
 
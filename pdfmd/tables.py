@@ -19,11 +19,13 @@ Detection results are returned as TableDetection objects containing the
 extracted grid and metadata for rendering.
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Tuple, Dict
 import re
 
 from .models import PageText, Block, Line
+from .utils import log
 
 
 # ---------------------------------------------------------------------------
@@ -104,12 +106,17 @@ def detect_tables_on_page(page: PageText, debug: bool = False) -> List[TableDete
     ascii_candidates: Dict[int, TableDetection] = {}
     vertical_candidates: Dict[int, TableDetection] = {}
 
+    # Each block's line texts are joined once here and shared by every
+    # strategy, instead of being rebuilt from spans on each visit.
+    block_texts = [_block_line_texts(block) for block in page.blocks]
+    non_table = [_block_is_obviously_non_table(texts) for texts in block_texts]
+
     # Strategy 1: Bordered table detection (highest confidence)
-    for idx, block in enumerate(page.blocks):
-        if _block_is_obviously_non_table(block):
+    for idx, texts in enumerate(block_texts):
+        if non_table[idx]:
             continue
 
-        grid = _detect_bordered_table(block)
+        grid = _detect_bordered_table(texts)
         if grid is None:
             continue
 
@@ -126,13 +133,13 @@ def detect_tables_on_page(page: PageText, debug: bool = False) -> List[TableDete
         )
 
     # Strategy 2: ASCII / single-block detection (most common case)
-    for idx, block in enumerate(page.blocks):
+    for idx, texts in enumerate(block_texts):
         if idx in bordered_candidates:  # Skip if already detected as bordered
             continue
-        if _block_is_obviously_non_table(block):
+        if non_table[idx]:
             continue
 
-        grid = _detect_ascii_table_in_block(block)
+        grid = _detect_ascii_table_in_block(texts)
         if grid is None:
             continue
 
@@ -156,7 +163,7 @@ def detect_tables_on_page(page: PageText, debug: bool = False) -> List[TableDete
             start += 1
             continue
             
-        run = _detect_vertical_run(page, start)
+        run = _detect_vertical_run(block_texts, start)
         if run is None:
             start += 1
             continue
@@ -213,17 +220,13 @@ def detect_tables_on_page(page: PageText, debug: bool = False) -> List[TableDete
 
     # Debug logging
     if debug:
-        try:
-            from .utils import log
-            log(f"[tables] Page has {len(page.blocks)} blocks")
-            log(f"[tables] Candidates: {len(bordered_candidates)} bordered, "
-                f"{len(ascii_candidates)} ASCII, {len(vertical_candidates)} vertical")
-            log(f"[tables] Final detections: {len(detections)}")
-            for i, det in enumerate(detections):
-                log(f"[tables]   {i+1}. {det.detection_type}: {det.n_rows}x{det.n_cols}, "
-                    f"score={det.score:.2f}, blocks={det.n_blocks}")
-        except ImportError:
-            pass  # utils not available, skip debug output
+        log(f"[tables] Page has {len(page.blocks)} blocks")
+        log(f"[tables] Candidates: {len(bordered_candidates)} bordered, "
+            f"{len(ascii_candidates)} ASCII, {len(vertical_candidates)} vertical")
+        log(f"[tables] Final detections: {len(detections)}")
+        for i, det in enumerate(detections):
+            log(f"[tables]   {i+1}. {det.detection_type}: {det.n_rows}x{det.n_cols}, "
+                f"score={det.score:.2f}, blocks={det.n_blocks}")
 
     return detections
 
@@ -235,7 +238,7 @@ def detect_tables_on_page(page: PageText, debug: bool = False) -> List[TableDete
 
 def _line_text(line: Line) -> str:
     """Join all span texts in a line."""
-    return "".join(sp.text for sp in line.spans)
+    return line.text()
 
 
 def _block_line_texts(block: Block) -> List[str]:
@@ -253,7 +256,7 @@ def _block_line_texts(block: Block) -> List[str]:
 # ---------------------------------------------------------------------------
 
 
-def _detect_bordered_table(block: Block) -> Optional[List[List[str]]]:
+def _detect_bordered_table(texts: List[str]) -> Optional[List[List[str]]]:
     """Detect tables with | or ¦ delimiters (Markdown-style or plain text).
     
     Examples:
@@ -264,10 +267,12 @@ def _detect_bordered_table(block: Block) -> Optional[List[List[str]]]:
         Name | Age | City
         Alice| 30  | New York
     
+    Args:
+        texts: Non-empty line texts of one block (see _block_line_texts)
+
     Returns:
         Grid of cells if a valid bordered table is found, None otherwise.
     """
-    texts = _block_line_texts(block)
     if len(texts) < 2:
         return None
     
@@ -323,13 +328,13 @@ def _detect_bordered_table(block: Block) -> Optional[List[List[str]]]:
 # ---------------------------------------------------------------------------
 
 
-def _block_can_start_vertical(block: Block) -> bool:
-    """Check if a block can be the first row of a vertical table.
+def _block_can_start_vertical(texts: List[str]) -> bool:
+    """Check if a block (given by its line texts) can be the first row of a
+    vertical table.
     
     Vertical tables have each row as a separate block, with consistent
     line counts across blocks.
     """
-    texts = _block_line_texts(block)
     n = len(texts)
     if n < 2 or n > 6:
         return False
@@ -347,33 +352,35 @@ def _block_can_start_vertical(block: Block) -> bool:
 
 
 def _detect_vertical_run(
-    page: PageText, start_idx: int
+    block_texts: List[List[str]], start_idx: int
 ) -> Optional[Tuple[int, int, List[List[str]]]]:
     """Detect a vertical multi-block table starting at start_idx.
     
+    Args:
+        block_texts: Per-block non-empty line texts for the page
+        start_idx: Index of the candidate first block
+
     Returns:
         Tuple of (start_idx, end_idx, grid) if valid, None otherwise.
         end_idx is exclusive (one past the last block in the table).
     """
-    if start_idx >= len(page.blocks):
+    if start_idx >= len(block_texts):
         return None
 
-    first = page.blocks[start_idx]
-    if not _block_can_start_vertical(first):
+    first_texts = block_texts[start_idx]
+    if not _block_can_start_vertical(first_texts):
         return None
 
-    first_texts = _block_line_texts(first)
     col_count = len(first_texts)
     if col_count < 2:
         return None
 
-    blocks: List[Block] = [first]
+    rows: List[List[str]] = [first_texts]
     idx = start_idx + 1
-    n_blocks = len(page.blocks)
+    n_blocks = len(block_texts)
 
     while idx < n_blocks:
-        blk = page.blocks[idx]
-        texts = _block_line_texts(blk)
+        texts = block_texts[idx]
 
         if len(texts) != col_count:
             break
@@ -382,16 +389,16 @@ def _detect_vertical_run(
         if _is_code_like_block(texts):
             break
 
-        blocks.append(blk)
+        rows.append(texts)
         idx += 1
 
     # Need ≥3 blocks to avoid 2-block paragraph pairs
-    if len(blocks) < 3:
+    if len(rows) < 3:
         return None
 
     grid: List[List[str]] = []
-    for blk in blocks:
-        row = [t.strip() for t in _block_line_texts(blk)]
+    for texts in rows:
+        row = [t.strip() for t in texts]
         if len(row) < col_count:
             row.extend('' for _ in range(col_count - len(row)))
         elif len(row) > col_count:
@@ -422,6 +429,11 @@ def _split_cells(text: str) -> List[str]:
     s = text.rstrip()
     if not s:
         return [""]
+
+    # No run of two blanks means neither pattern can split; most prose
+    # lines end here without touching the regex engine.
+    if "  " not in s and "\t" not in s:
+        return [s]
     
     # Try conservative split first
     cells = _CELL_SPLIT_RE_CONSERVATIVE.split(s)
@@ -432,8 +444,12 @@ def _split_cells(text: str) -> List[str]:
     return _CELL_SPLIT_RE_RELAXED.split(s)
 
 
-def _block_is_obviously_non_table(block: Block) -> bool:
-    """Quick filter to skip blocks that are clearly not tables.
+_BULLET_START_CHARS = frozenset('•◦-*')
+
+
+def _block_is_obviously_non_table(texts: List[str]) -> bool:
+    """Quick filter to skip blocks (given by their line texts) that are
+    clearly not tables.
     
     Checks for:
     - Too few lines
@@ -441,7 +457,6 @@ def _block_is_obviously_non_table(block: Block) -> bool:
     - High concentration of list markers
     - Lines starting with bullets
     """
-    texts = _block_line_texts(block)
     if len(texts) < 2:
         return True
 
@@ -450,27 +465,32 @@ def _block_is_obviously_non_table(block: Block) -> bool:
         if not any(len(_split_cells(t)) >= 2 for t in texts):
             return True
 
-    # High concentration of list markers
-    list_like = sum(1 for t in texts if _is_list_like_line(t))
-    if list_like >= max(2, int(0.8 * len(texts))):
-        return True
-    
-    # Nearly all lines start with bullets (strong list signal)
-    bullet_chars = set('•◦◦-*')
-    bullet_starters = sum(1 for t in texts if t.lstrip()[:1] in bullet_chars)
-    if bullet_starters >= len(texts) * 0.9:
-        return True
+    # High concentration of list markers, or nearly all lines starting with
+    # bullets (strong list signal). Both are counted in one pass and either
+    # one ends the scan as soon as it is reached.
+    list_needed = max(2, int(0.8 * len(texts)))
+    bullet_needed = len(texts) * 0.9
+    list_like = 0
+    bullet_starters = 0
+    for t in texts:
+        if _is_list_like_line(t):
+            list_like += 1
+            if list_like >= list_needed:
+                return True
+        if t.lstrip()[:1] in _BULLET_START_CHARS:
+            bullet_starters += 1
+            if bullet_starters >= bullet_needed:
+                return True
 
     return False
 
 
-def _detect_ascii_table_in_block(block: Block) -> Optional[List[List[str]]]:
+def _detect_ascii_table_in_block(texts: List[str]) -> Optional[List[List[str]]]:
     """Detect whitespace-separated tables within a single block.
     
     Uses the most common column count as the target and normalizes rows
     to that width, merging overflow content into the last column.
     """
-    texts = _block_line_texts(block)
     if len(texts) < 2:
         return None
 
@@ -783,6 +803,9 @@ def _grid_passes_profile(prof: GridProfile) -> bool:
 # ---------------------------------------------------------------------------
 
 
+_LIST_PREFIX_RE = re.compile(r"(\d+|[A-Za-z])[.)]\s")
+
+
 def _is_list_like_line(text: str) -> bool:
     """Check if a line starts with a list marker.
     
@@ -795,18 +818,22 @@ def _is_list_like_line(text: str) -> bool:
     if not s:
         return False
 
+    c0 = s[0]
+
     # Bullet markers
-    if s[0] in ('-', '•', '◦', '◦', '*') and (len(s) == 1 or s[1].isspace()):
+    if c0 in '-•◦*' and (len(s) == 1 or s[1].isspace()):
         return True
 
-    # Numbered or lettered lists
-    if re.match(r'^(\d+|[A-Za-z])(\.|\))\s+', s):
+    # Numbered or lettered lists (cheap first-char gate before the regex)
+    if c0.isalnum() and _LIST_PREFIX_RE.match(s) is not None:
         return True
 
     return False
 
 
 _CODE_SYMBOLS = set('{}[]();<>/=*+-')
+# Deletes the code symbols, so their count is a length difference.
+_DROP_CODE_SYMBOLS = str.maketrans('', '', ''.join(_CODE_SYMBOLS))
 
 
 def _is_code_like_block(lines: Iterable[str]) -> bool:
@@ -821,8 +848,11 @@ def _is_code_like_block(lines: Iterable[str]) -> bool:
     if not texts:
         return False
 
+    needed = max(2, len(texts) // 2)
     suspicious = 0
     for t in texts:
+        if suspicious >= needed:
+            return True
         lower = t.lower()
         
         # Programming keywords
@@ -835,16 +865,18 @@ def _is_code_like_block(lines: Iterable[str]) -> bool:
             suspicious += 1
             continue
 
-        # Symbol density
-        non_space = [c for c in t if not c.isspace()]
+        # Symbol density, counted in C: split() drops exactly the
+        # characters isspace() accepts, translate() drops the symbols.
+        non_space = "".join(t.split())
         if not non_space:
             continue
         
-        code_ratio = sum(c in _CODE_SYMBOLS for c in non_space) / float(len(non_space))
+        n_symbols = len(non_space) - len(non_space.translate(_DROP_CODE_SYMBOLS))
+        code_ratio = n_symbols / float(len(non_space))
         if code_ratio >= 0.35:
             suspicious += 1
 
-    return suspicious >= max(2, len(texts) // 2)
+    return suspicious >= needed
 
 
 def _most_common_int(vals: List[int]) -> Tuple[int, int]:
@@ -856,12 +888,8 @@ def _most_common_int(vals: List[int]) -> Tuple[int, int]:
     if not vals:
         return 0, 0
     
-    counts: Dict[int, int] = {}
-    for v in vals:
-        counts[v] = counts.get(v, 0) + 1
-    
-    best = max(counts, key=lambda x: counts[x])
-    return best, counts[best]
+    # Counter counts in C; most_common(1) keeps the first-seen value on ties.
+    return Counter(vals).most_common(1)[0]
 
 
 __all__ = [
@@ -20,17 +20,24 @@ upstream stages can compare before and after if needed.
 
 from collections import Counter
 from dataclasses import replace
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 import re
 
-from .models import PageText, Block, Line, Span, Options
+from .models import PageText, Block, Line, Span, Options, median_safe
 from .tables import detect_tables_on_page
 from .equations import annotate_math_on_page
+from .utils import log
 
 
 # --------------------------- CAPS heuristics ---------------------------
 
 
+# ASCII bytes that are not letters, and ASCII lowercase letters; used with
+# bytes.translate to count letters in C for pure-ASCII lines.
+_ASCII_NON_LETTERS = bytes(i for i in range(128) if not chr(i).isalpha())
+_ASCII_LOWERCASE = bytes(range(ord("a"), ord("z") + 1))
+
+
 def is_all_caps_line(s: str) -> bool:
     """Return True if a line is entirely alphabetic and all caps.
 
@@ -40,6 +47,10 @@ def is_all_caps_line(s: str) -> bool:
     if not s:
         return False
 
+    # Every ASCII letter is cased, so str.isupper() gives the same answer.
+    if s.isascii():
+        return s.isupper()
+
     letters = [ch for ch in s if ch.isalpha()]
     if not letters:
         return False
@@ -57,6 +68,13 @@ def is_mostly_caps(s: str, threshold: float = 0.7) -> bool:
     if not s:
         return False
 
+    if s.isascii():
+        raw = s.encode("ascii").translate(None, _ASCII_NON_LETTERS)
+        if not raw:
+            return False
+        upper = len(raw.translate(None, _ASCII_LOWERCASE))
+        return upper / len(raw) >= threshold
+
     letters = [ch for ch in s if ch.isalpha()]
     if not letters:
         return False
@@ -68,27 +86,32 @@ def is_mostly_caps(s: str, threshold: float = 0.7) -> bool:
 
 def _line_text(line: Line) -> str:
     """Join all span texts in a line and strip outer whitespace."""
-    return "".join(sp.text for sp in line.spans).strip()
+    return line.text().strip()
+
 
+def _edge_line_texts(page: PageText) -> Tuple[str, str]:
+    """Return the texts of the first and last non empty lines on a page.
 
-def _first_nonblank_line_text(page: PageText) -> str:
-    """Return the text of the first non empty line on a page."""
+    The last line is found by scanning backwards, so only the lines around
+    each edge are joined. A page with no text is walked exactly once.
+    """
+    first = ""
     for blk in page.blocks:
         for ln in blk.lines:
-            t = _line_text(ln)
-            if t:
-                return t
-    return ""
-
+            first = _line_text(ln)
+            if first:
+                break
+        if first:
+            break
+    if not first:
+        return "", ""
 
-def _last_nonblank_line_text(page: PageText) -> str:
-    """Return the text of the last non empty line on a page."""
     for blk in reversed(page.blocks):
         for ln in reversed(blk.lines):
             t = _line_text(ln)
             if t:
-                return t
-    return ""
+                return first, t
+    return first, first
 
 
 # ------------------------- Header/footer detection -------------------------
@@ -96,6 +119,7 @@ def _last_nonblank_line_text(page: PageText) -> str:
 
 _HEADER_SIMILARITY_THRESHOLD = 0.8
 _FOOTER_SIMILARITY_THRESHOLD = 0.8
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
 
 
 def _normalized_text(s: str) -> str:
@@ -107,7 +131,7 @@ def _normalized_text(s: str) -> str:
     s = s.strip()
     if not s:
         return ""
-    return re.sub(r"\s+", " ", s).lower()
+    return _WHITESPACE_RUN_PATTERN.sub(" ", s).lower()
 
 
 def _similarity(a: str, b: str) -> float:
@@ -120,8 +144,11 @@ def _similarity(a: str, b: str) -> float:
     nb = _normalized_text(b)
     if not na or not nb:
         return 0.0
-    sa = set(na.split())
-    sb = set(nb.split())
+    return _word_similarity(set(na.split()), set(nb.split()))
+
+
+def _word_similarity(sa: set, sb: set) -> float:
+    """Jaccard similarity of two word sets (see `_similarity`)."""
     inter = len(sa & sb)
     union = len(sa | sb)
     if union == 0:
@@ -129,6 +156,15 @@ def _similarity(a: str, b: str) -> float:
     return inter / union
 
 
+def _matches_edge(norm: str, edges: List[Tuple[str, set]]) -> bool:
+    """Return True if normalized line text matches any (norm, words) edge."""
+    words = set(norm.split())
+    for edge_norm, edge_words in edges:
+        if norm == edge_norm or _word_similarity(words, edge_words) >= 0.95:
+            return True
+    return False
+
+
 def detect_repeating_edges(
     pages: List[PageText],
 ) -> Tuple[Optional[str], Optional[str]]:
@@ -150,8 +186,7 @@ def detect_repeating_edges(
     footer_candidates: List[str] = []
 
     for p in pages:
-        h = _first_nonblank_line_text(p)
-        f = _last_nonblank_line_text(p)
+        h, f = _edge_line_texts(p)
         if h:
             header_candidates.append(h)
         if f:
@@ -164,19 +199,19 @@ def detect_repeating_edges(
         if not candidates:
             return None
 
-        normalized = [_normalized_text(c) for c in candidates if c.strip()]
-        if not normalized:
+        pairs = [(c, _normalized_text(c)) for c in candidates if c.strip()]
+        if not pairs:
             return None
 
-        counts = Counter(normalized)
+        counts = Counter(n for _, n in pairs)
         most_common, freq = counts.most_common(1)[0]
-        frac = freq / len(normalized)
+        frac = freq / len(pairs)
         if frac < threshold:
             return None
 
         # Return one original candidate that matches the normalized winner.
-        for c in candidates:
-            if _normalized_text(c) == most_common:
+        for c, n in pairs:
+            if n == most_common:
                 return c
         return None
 
@@ -225,8 +260,12 @@ def remove_header_footer(
     if not pages:
         return pages
 
-    header_norm = _normalized_text(header) if header else ""
-    footer_norm = _normalized_text(footer) if footer else ""
+    # Normalize each edge and split it into words once, not once per line.
+    edges: List[Tuple[str, set]] = []
+    for edge in (header, footer):
+        if edge:
+            edge_norm = _normalized_text(edge)
+            edges.append((edge_norm, set(edge_norm.split())))
 
     out_pages: List[PageText] = []
 
@@ -237,21 +276,24 @@ def remove_header_footer(
             new_lines: List[Line] = []
             for ln in blk.lines:
                 text = _line_text(ln)
-                norm = _normalized_text(text)
 
-                # Strip header if it matches (or is very close).
-                if header and norm and _similarity(norm, header_norm) >= 0.95:
-                    continue
+                # Strip header/footer if it matches (or is very close).
+                if edges:
+                    norm = _normalized_text(text)
+                    if norm and _matches_edge(norm, edges):
+                        continue
 
-                # Strip footer if it matches (or is noise).
-                if footer and norm and _similarity(norm, footer_norm) >= 0.95:
-                    continue
+                # Strip footer noise.
                 if _is_footer_noise(text):
                     continue
 
                 new_lines.append(ln)
 
-            if new_lines:
+            if len(new_lines) == len(blk.lines):
+                # Nothing stripped: reuse the block instead of copying it.
+                if new_lines:
+                    new_blocks.append(blk)
+            elif new_lines:
                 new_blocks.append(replace(blk, lines=new_lines))
 
         out_pages.append(replace(p, blocks=new_blocks))
@@ -442,18 +484,7 @@ def estimate_body_size(pages: List[PageText]) -> List[float]:
             if sp.size > 0 and (sp.text or "").strip()
         ]
 
-        if not sizes:
-            body_sizes.append(11.0)
-            continue
-
-        sizes_sorted = sorted(sizes)
-        mid = len(sizes_sorted) // 2
-        if len(sizes_sorted) % 2 == 1:
-            median = sizes_sorted[mid]
-        else:
-            median = 0.5 * (sizes_sorted[mid - 1] + sizes_sorted[mid])
-
-        body_sizes.append(median)
+        body_sizes.append(median_safe(sizes) if sizes else 11.0)
 
     return body_sizes
 
@@ -507,13 +538,9 @@ def _annotate_tables_on_page(page: PageText, debug: bool = False) -> PageText:
             setattr(blk, "table_score", det.score)
             
             if debug:
-                try:
-                    from .utils import log
-                    log(f"[transform] Annotated block {idx} as table "
-                        f"({det.detection_type}, {det.n_rows}x{det.n_cols}, "
-                        f"score={det.score:.2f})")
-                except ImportError:
-                    pass
+                log(f"[transform] Annotated block {idx} as table "
+                    f"({det.detection_type}, {det.n_rows}x{det.n_cols}, "
+                    f"score={det.score:.2f})")
         
         new_blocks.append(blk)
     
@@ -540,6 +567,7 @@ def transform_pages(
     pages: List[PageText], 
     options: Options,
     debug_tables: bool = False,
+    progress_cb: Optional[Callable[[int, int], None]] = None,
 ) -> Tuple[List[PageText], Optional[str], Optional[str], List[float]]:
     """Run the standard transform pipeline.
 
@@ -555,6 +583,8 @@ def transform_pages(
         pages: Raw extracted PageText objects
         options: Transformation options (from models.Options)
         debug_tables: Enable debug logging for table detection
+        progress_cb: Optional per-page callback (done, total), called while
+                     annotating math; also serves as a cancellation point.
         
     Returns:
         Tuple of:
@@ -581,8 +611,11 @@ def transform_pages(
     pages_t = annotate_tables(pages_t, debug=debug_tables)
 
     # 5. Detect and annotate math equations and expressions.
-    for page in pages_t:
+    total = len(pages_t)
+    for i, page in enumerate(pages_t):
         annotate_math_on_page(page)
+        if progress_cb:
+            progress_cb(i + 1, total)
 
     # 6. Compute per page body font size baselines for heading promotion.
     body_sizes = estimate_body_size(pages_t)
@@ -11,6 +11,7 @@ from __future__ import annotations
 import os
 import sys
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -25,11 +26,14 @@ def is_windows() -> bool:
     return os.name == "nt" or sys.platform.lower().startswith("win")
 
 
+@lru_cache(maxsize=256)
 def os_display_path(p: os.PathLike | str) -> str:
     """Return a user-facing path string with OS-appropriate separators.
 
     On Windows: backslashes (\\)
     On POSIX:   forward slashes (/)
+
+    Pure, so results are memoized; the GUI calls this on every path edit.
     """
     s = str(p)
     if not s:
@@ -117,6 +121,7 @@ _PUNCT_MAP = {
     # Ellipsis
     "\u2026": "...",  # …
 }
+_PUNCT_TABLE = str.maketrans(_PUNCT_MAP)
 
 
 def normalize_punctuation(text: str) -> str:
@@ -126,10 +131,8 @@ def normalize_punctuation(text: str) -> str:
     """
     if not text:
         return text
-    out = []
-    for ch in text:
-        out.append(_PUNCT_MAP.get(ch, ch))
-    return "".join(out)
+    # One C-level pass instead of a per-character Python loop.
+    return text.translate(_PUNCT_TABLE)
 
 
 _URL_RE = re.compile(
@@ -146,7 +149,7 @@ def linkify_urls(text: str) -> str:
     """
 
     def _repl(match: re.Match) -> str:
-        url = match.group("url")
+        url: str = match.group("url")
         # Avoid double-wrapping if already inside <...>
         if url.startswith("<") and url.endswith(">"):
             return url
@@ -155,6 +158,12 @@ def linkify_urls(text: str) -> str:
             return f"<https://{url}>"
         return f"<{url}>"
 
+    # Most paragraphs have no URL; two substring checks are far cheaper than
+    # a case-insensitive regex scan. lower() keeps the check a superset of
+    # what _URL_RE (IGNORECASE) can match.
+    low = text.lower()
+    if "http" not in low and "www." not in low:
+        return text
     return _URL_RE.sub(_repl, text)
 
 
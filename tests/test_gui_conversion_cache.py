@@ -0,0 +1,106 @@
+"""Tests for the GUI's "already up to date" conversion cache."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+app_gui = pytest.importorskip("pdfmd.app_gui")
+
+
+OPTS = {"ocr_mode": "off", "export_images": False}
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "in.pdf"
+    path.write_bytes(b"%PDF-1.4 test")
+    return path
+
+
+def test_fingerprint_is_stable(pdf, tmp_path):
+    out = tmp_path / "in.md"
+    assert app_gui._conversion_fingerprint(pdf, out, OPTS) == app_gui._conversion_fingerprint(
+        pdf, out, dict(OPTS)
+    )
+
+
+def test_fingerprint_tracks_input_output_and_options(pdf, tmp_path):
+    out = tmp_path / "in.md"
+    base = app_gui._conversion_fingerprint(pdf, out, OPTS)
+
+    assert app_gui._conversion_fingerprint(pdf, tmp_path / "other.md", OPTS) != base
+    assert app_gui._conversion_fingerprint(pdf, out, {**OPTS, "export_images": True}) != base
+
+    st = os.stat(pdf)
+    os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert app_gui._conversion_fingerprint(pdf, out, OPTS) != base
+
+
+def test_fingerprint_tracks_version(pdf, tmp_path, monkeypatch):
+    out = tmp_path / "in.md"
+    base = app_gui._conversion_fingerprint(pdf, out, OPTS)
+    monkeypatch.setattr(app_gui, "PDFMD_VERSION", "999.0.0")
+    assert app_gui._conversion_fingerprint(pdf, out, OPTS) != base
+
+
+def test_fingerprint_tracks_ocr_tools_only_when_ocr_is_used(pdf, tmp_path, monkeypatch):
+    out = tmp_path / "in.md"
+    auto = {**OPTS, "ocr_mode": "auto"}
+
+    monkeypatch.setattr(app_gui.shutil, "which", lambda cmd: None)
+    off_before = app_gui._conversion_fingerprint(pdf, out, OPTS)
+    auto_before = app_gui._conversion_fingerprint(pdf, out, auto)
+
+    monkeypatch.setattr(app_gui.shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+    assert app_gui._conversion_fingerprint(pdf, out, OPTS) == off_before
+    assert app_gui._conversion_fingerprint(pdf, out, auto) != auto_before
+
+
+def test_cache_round_trip(tmp_path):
+    out = tmp_path / "in.md"
+    out.write_text("# done", encoding="utf-8")
+    cache_path = tmp_path / "cache.json"
+
+    cache = app_gui.ConversionCache(cache_path)
+    assert not cache.is_up_to_date("fp", out)
+    cache.remember("fp", out)
+    assert cache.is_up_to_date("fp", out)
+
+    # Persisted for the next session.
+    assert app_gui.ConversionCache(cache_path).is_up_to_date("fp", out)
+
+
+def test_cache_rejects_changed_or_missing_output(tmp_path):
+    out = tmp_path / "in.md"
+    out.write_text("# done", encoding="utf-8")
+    cache = app_gui.ConversionCache(tmp_path / "cache.json")
+    cache.remember("fp", out)
+
+    st = os.stat(out)
+    os.utime(out, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert not cache.is_up_to_date("fp", out)
+
+    out.unlink()
+    assert not cache.is_up_to_date("fp", out)
+
+
+def test_cache_drops_oldest_entries(tmp_path):
+    out = tmp_path / "in.md"
+    out.write_text("# done", encoding="utf-8")
+    cache = app_gui.ConversionCache(tmp_path / "cache.json", max_entries=2)
+    for fp in ("a", "b", "c"):
+        cache.remember(fp, out)
+
+    assert not cache.is_up_to_date("a", out)
+    assert cache.is_up_to_date("b", out)
+    assert cache.is_up_to_date("c", out)
+
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    out = tmp_path / "in.md"
+    out.write_text("# done", encoding="utf-8")
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("not json", encoding="utf-8")
+
+    assert not app_gui.ConversionCache(cache_path).is_up_to_date("fp", out)